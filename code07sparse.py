@@ -0,0 +1,226 @@
+# 🟢 Sparse pivot_table for code6.py / code07.py's Name × Subject scores
+#
+# df.pivot_table(index='Name', columns='Subject', values='Score', aggfunc='mean') returns one
+# dense cell for every Name × Subject pair, NaN where the pair never occurs (Charlie has no
+# SST score). With millions of names × thousands of subjects that grid does not fit in memory
+# even though almost all of it is NaN.
+#
+# sparse_pivot_table() aggregates the observed pairs only and stores them as CSR:
+#   indptr  — the cells of row i are at positions indptr[i]:indptr[i + 1]
+#   indices — column number of every stored cell (ascending inside a row)
+#   data    — aggregated value of every stored cell
+# Memory is about 12 bytes per observed pair plus the two label indexes; the full grid is
+# never allocated. Dense data is only built for the slice asked for:
+#   pivot.dense(['Alice', 'Bob'])          → DataFrame, same cells as pivot_table for those rows
+#   pivot.iter_dense(chunk_rows=100_000)   → the whole table as dense row chunks
+#   pivot.to_coo() / to_sparse_frame() / to_scipy()
+
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from reshape import AGGFUNCS
+
+try:
+    import scipy.sparse as sp
+except ImportError:  # pragma: no cover - depends on the environment
+    sp = None
+
+
+class SparsePivot:
+
+    def __init__(self, index, columns, indptr, indices, data):
+        self.index, self.columns = index, columns
+        self.indptr, self.indices, self.data = indptr, indices, data
+
+    @property
+    def shape(self):
+        return len(self.index), len(self.columns)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @property
+    def nbytes(self):
+        return self.indptr.nbytes + self.indices.nbytes + self.data.nbytes
+
+    @property
+    def density(self):
+        n, m = self.shape
+        return self.nnz / (n * m) if n and m else 0.0
+
+    # 🟢 (row numbers, column numbers, values) of every stored cell
+    def to_coo(self):
+        rows = np.repeat(np.arange(len(self.index), dtype=np.int32), np.diff(self.indptr))
+        return rows, self.indices, self.data
+
+    def to_scipy(self):
+        if sp is None:
+            raise ImportError('to_scipy() needs scipy')
+        return sp.csr_matrix((self.data, self.indices, self.indptr), shape=self.shape)
+
+    # 🟢 Row numbers → positions of their cells in indices / data
+    def _cells_of(self, rows):
+        starts, ends = self.indptr[rows], self.indptr[rows + 1]
+        lengths = ends - starts
+        owner = np.repeat(np.arange(len(rows)), lengths)
+        first = np.repeat(starts - np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths)
+        return owner, first + np.arange(lengths.sum())
+
+    @staticmethod
+    def _positions(labels, axis):
+        found = axis.get_indexer(labels)
+        if (found < 0).any():
+            raise KeyError(list(np.asarray(labels, dtype=object)[found < 0]))
+        return found
+
+    # 🟢 Dense DataFrame for some rows / columns (labels); None means all of them
+    def dense(self, rows=None, columns=None):
+        row_pos = np.arange(len(self.index)) if rows is None else self._positions(rows, self.index)
+        col_pos = np.arange(len(self.columns)) if columns is None else self._positions(columns, self.columns)
+        owner, cells = self._cells_of(row_pos)
+        out_col = np.full(len(self.columns), -1, dtype=np.int64)
+        out_col[col_pos] = np.arange(len(col_pos))
+        target = out_col[self.indices[cells]]
+        wanted = target >= 0
+        grid = np.full((len(row_pos), len(col_pos)), np.nan)
+        grid[owner[wanted], target[wanted]] = self.data[cells[wanted]]
+        return pd.DataFrame(grid, index=self.index[row_pos], columns=self.columns[col_pos], copy=False)
+
+    def iter_dense(self, chunk_rows=100_000, columns=None):
+        for start in range(0, len(self.index), chunk_rows):
+            yield self.dense(self.index[start:start + chunk_rows], columns)
+
+    def to_dense(self):
+        return self.dense()
+
+    # 🟢 pandas DataFrame with one SparseDtype column per column label (NaN not stored)
+    # Each column goes through one reused dense buffer: SparseArray keeps only its non-NaN
+    # values, so at most one dense column exists at a time
+    def to_sparse_frame(self):
+        rows, cols, data = self.to_coo()
+        order = np.argsort(cols, kind='stable')        # column-major, rows stay ascending
+        bounds = np.searchsorted(cols[order], np.arange(len(self.columns) + 1))
+        column = np.full(len(self.index), np.nan)
+        frame = {}
+        for k, label in enumerate(self.columns):
+            take = order[bounds[k]:bounds[k + 1]]
+            column[rows[take]] = data[take]
+            frame[label] = pd.arrays.SparseArray(column, fill_value=np.nan)
+            column[rows[take]] = np.nan
+        return pd.DataFrame(frame, index=self.index)
+
+    def __repr__(self):
+        return (f'SparsePivot(shape={self.shape}, nnz={self.nnz}, density={self.density:.2%}, '
+                f'nbytes={self.nbytes})')
+
+
+# 🟢 Same cells as df.pivot_table(index=..., columns=..., values=..., aggfunc=...), stored sparse
+def sparse_pivot_table(df, index, columns, values, aggfunc='mean'):
+    if aggfunc not in AGGFUNCS:
+        raise ValueError(f'aggfunc must be one of {AGGFUNCS}')
+    data = df[values].to_numpy(dtype=np.float64, na_value=np.nan)
+    keep = df[index].notna().to_numpy() & df[columns].notna().to_numpy()
+    if aggfunc in ('sum', 'count'):
+        # A pair whose scores are all NaN still gets a cell (0), like pivot_table
+        valid = ~np.isnan(data)
+        data = np.where(valid, data, 0.0) if aggfunc == 'sum' else valid.astype(np.float64)
+    else:
+        keep &= ~np.isnan(data)
+    frame = df.loc[keep, [index, columns]] if not keep.all() else df
+    data = data[keep] if not keep.all() else data
+
+    # Labels only of rows that are kept, so no all-NaN row or column (like dropna=True)
+    ri, row_labels = pd.factorize(frame[index], sort=True)
+    ci, col_labels = pd.factorize(frame[columns], sort=True)
+    cell = ri.astype(np.int64)
+    cell *= len(col_labels)
+    cell += ci
+    # One slot per observed pair; sorted cell numbers are already row-major (CSR order)
+    cells, slot = np.unique(cell, return_inverse=True)
+    del cell
+
+    if aggfunc in ('mean', 'sum', 'count'):
+        # count: data holds 1.0 for every non-NaN score, so the weighted sum is the count
+        out = np.bincount(slot, weights=data, minlength=len(cells))
+        if aggfunc == 'mean':
+            out /= np.bincount(slot, minlength=len(cells))
+    else:
+        out = np.full(len(cells), np.inf if aggfunc == 'min' else -np.inf)
+        (np.minimum if aggfunc == 'min' else np.maximum).at(out, slot, data)
+
+    m = max(len(col_labels), 1)
+    rows = cells // m
+    indptr = np.searchsorted(rows, np.arange(len(row_labels) + 1)).astype(np.int64)
+    indices = (cells % m).astype(np.int32)
+    return SparsePivot(pd.Index(row_labels, name=index), pd.Index(col_labels, name=columns),
+                       indptr, indices, out)
+
+
+# =========================
+# 🟢 Benchmark: dense pivot_table vs sparse_pivot_table
+# A grid small enough for pandas to finish, then one whose dense form would not fit
+# =========================
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = fn()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return out, {'seconds': seconds, 'peak_mb': peak / 2 ** 20}
+
+
+def _scores(n_rows, n_names, n_subjects, rng):
+    return pd.DataFrame({'Name': rng.integers(0, n_names, n_rows),
+                         'Subject': rng.integers(0, n_subjects, n_rows),
+                         'Score': rng.integers(0, 100, n_rows).astype(np.float64)})
+
+
+def benchmark(seed=0):
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    df = _scores(1_000_000, 50_000, 1_000, rng)
+    expected, results['pivot_table 50k×1k'] = _measure(
+        lambda: df.pivot_table(index='Name', columns='Subject', values='Score', aggfunc='mean'))
+    got, results['sparse 50k×1k'] = _measure(lambda: sparse_pivot_table(df, 'Name', 'Subject', 'Score'))
+    assert np.allclose(got.to_dense().to_numpy(), expected.to_numpy(), equal_nan=True)
+    results['sparse 50k×1k']['stored_mb'] = got.nbytes / 2 ** 20
+    results['sparse 50k×1k']['dense_mb'] = float(expected.memory_usage().sum()) / 2 ** 20
+    del df, expected, got
+
+    # 5M names × 10k subjects: the dense grid would be 400 GB
+    df = _scores(10_000_000, 5_000_000, 10_000, rng)
+    got, results['sparse 5M×10k'] = _measure(lambda: sparse_pivot_table(df, 'Name', 'Subject', 'Score'))
+    results['sparse 5M×10k']['stored_mb'] = got.nbytes / 2 ** 20
+    results['sparse 5M×10k']['dense_gb'] = got.shape[0] * got.shape[1] * 8 / 2 ** 30
+    _, results['dense slice 1k rows'] = _measure(lambda: got.dense(got.index[:1_000]))
+    return results
+
+
+if __name__ == '__main__':
+    # 🟢 Same data as code07.py
+    df = pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Alice', 'Bob', 'Charlie', 'Charlie', 'Alice', 'Bob'],
+        'Subject': ['Math', 'Math', 'Science', 'Science', 'Math', 'Science', 'SST', 'SST'],
+        'Score': [85, 78, 90, 82, 88, 95, 75, 70]
+    })
+    pivot_df = sparse_pivot_table(df, 'Name', 'Subject', 'Score', aggfunc='mean')
+    print(pivot_df)
+    print(pivot_df.to_dense())
+
+    # Output:
+    # SparsePivot(shape=(3, 3), nnz=8, density=88.89%, nbytes=128)
+    # Subject  Math   SST  Science
+    # Name
+    # Alice    85.0  75.0     90.0
+    # Bob      78.0  70.0     82.0
+    # Charlie  88.0   NaN     95.0
+
+    print(pivot_df.dense(['Charlie'], ['SST', 'Science']))
+    print(benchmark())
@@ -1,5 +1,6 @@
 # 🟢 Creating a Sample Dataset
 import pandas as pd
+from code08zscore import group_zscore
 
 data = {
     'Employee': ['Alice', 'Bob', 'Charlie', 'David', 'Eva', 'Frank', 'Grace', 'Helen'],
@@ -56,7 +57,9 @@ print(df)
 # Output: New column with department's average salary per row
 
 # 🟢 11. Apply custom logic after groupby (e.g., z-score)
-df['Z_Score_Salary'] = df.groupby('Department')['Salary'].apply(lambda x: (x - x.mean()) / x.std())
+# Same as groupby(...).apply(lambda x: (x - x.mean()) / x.std()), but vectorized with group codes
+# and always aligned with df's rows (see code08zscore.py)
+df['Z_Score_Salary'] = group_zscore(df, 'Department', 'Salary')
 print(df)
 # Output: New column with z-scores of salary within each department
 
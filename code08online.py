@@ -0,0 +1,255 @@
+# 🟢 Incremental (online) groupby aggregator for the code08.py department statistics
+#
+# code08.py recomputes groupby('Department') over the full table every time.
+# OnlineGroupStats keeps running state per group instead:
+#   count, sum, M2 (sum of squared deviations from the mean), min, max
+#   + optional value counts (needed for describe() quartiles and for exact min/max
+#     after a retraction)
+# append(batch) and retract(batch) touch only the groups present in the batch,
+# so each update costs O(batch), not O(history).
+# Batch moments are merged with Chan's parallel formula, which stays accurate where a
+# raw sum of squares would lose precision on large salaries.
+
+import numpy as np
+import pandas as pd
+
+
+class OnlineGroupStats:
+
+    def __init__(self, keys, columns, track_values=True):
+        self.keys = [keys] if isinstance(keys, str) else list(keys)
+        self.columns = [columns] if isinstance(columns, str) else list(columns)
+        self.track_values = track_values
+        self._size = {}                                   # group → number of rows
+        self._stats = {col: {} for col in self.columns}   # col → group → [n, sum, M2, min, max]
+        self._values = {col: {} for col in self.columns}  # col → group → {value: count}
+        self._dtypes = {}
+
+    # 🟢 Per-group moments of one batch, computed vectorized by pandas
+    def _batch_moments(self, batch, col):
+        grouped = batch.groupby(self.keys, sort=False)[col]
+        moments = pd.DataFrame({
+            'n': grouped.count(),
+            'sum': grouped.sum(),
+            'mean': grouped.mean(),
+            'm2': grouped.var(ddof=0) * grouped.count(),
+            'min': grouped.min(),
+            'max': grouped.max(),
+        })
+        return moments[moments['n'] > 0]
+
+    def _value_counts(self, batch, col):
+        return batch.dropna(subset=[col]).groupby(self.keys + [col], sort=False).size()
+
+    # 🟢 Add a batch of new rows
+    def append(self, batch):
+        for col in self.columns:
+            # Output dtype covers every batch so far (int batch + float batch → float64)
+            dtype = batch[col].dtype
+            if len(batch):
+                self._dtypes[col] = np.result_type(self._dtypes[col], dtype) if col in self._dtypes else dtype
+        for key, n in batch.groupby(self.keys, sort=False).size().items():
+            self._size[key] = self._size.get(key, 0) + int(n)
+
+        for col in self.columns:
+            stats = self._stats[col]
+            for key, nb, sb, _, m2b, lo, hi in self._batch_moments(batch, col).itertuples(name=None):
+                nb = int(nb)
+                if key not in stats:
+                    stats[key] = [nb, sb, m2b, lo, hi]
+                    continue
+                na, sa, m2a, lo_a, hi_a = stats[key]
+                n = na + nb
+                delta = sb / nb - sa / na
+                stats[key] = [n, sa + sb, m2a + m2b + delta * delta * na * nb / n,
+                              min(lo_a, lo), max(hi_a, hi)]
+            if self.track_values:
+                values = self._values[col]
+                for (*key, value), count in self._value_counts(batch, col).items():
+                    key = key[0] if len(key) == 1 else tuple(key)
+                    counts = values.setdefault(key, {})
+                    counts[value] = counts.get(value, 0) + int(count)
+        return self
+
+    # 🟢 Remove rows that were appended earlier (e.g. corrections in the HR feed)
+    # The whole batch is checked first, so a rejected batch leaves the state untouched
+    def retract(self, batch):
+        sizes = batch.groupby(self.keys, sort=False).size()
+        moments = {col: self._batch_moments(batch, col) for col in self.columns}
+        value_counts = {col: self._value_counts(batch, col) for col in self.columns} if self.track_values else {}
+        self._check_retract(sizes, moments, value_counts)
+
+        for key, n in sizes.items():
+            left = self._size[key] - int(n)
+            if left:
+                self._size[key] = left
+            else:
+                del self._size[key]
+
+        for col in self.columns:
+            stats = self._stats[col]
+            for key, nb, sb, _, m2b, lo, hi in moments[col].itertuples(name=None):
+                nb = int(nb)
+                n, s, m2, lo_all, hi_all = stats[key]
+                na = n - nb
+                if na == 0:
+                    del stats[key]
+                    continue
+                delta = sb / nb - (s - sb) / na
+                # Reverse of Chan's merge; clamp tiny negative values caused by rounding
+                m2a = max(m2 - m2b - delta * delta * na * nb / n, 0.0)
+                if lo == lo_all or hi == hi_all:
+                    lo_all, hi_all = None, None     # the current min/max may have been removed
+                stats[key] = [na, s - sb, m2a, lo_all, hi_all]
+
+            if self.track_values:
+                values = self._values[col]
+                for (*key, value), count in value_counts[col].items():
+                    key = key[0] if len(key) == 1 else tuple(key)
+                    counts = values[key]
+                    counts[value] -= int(count)
+                    if counts[value] == 0:
+                        del counts[value]
+                    if not counts:
+                        del values[key]
+                for key, entry in stats.items():
+                    if entry[3] is None:
+                        entry[3], entry[4] = min(values[key]), max(values[key])
+        return self
+
+    def _check_retract(self, sizes, moments, value_counts):
+        for key, n in sizes.items():
+            if self._size.get(key, 0) < n:
+                raise ValueError(f'Cannot retract {n} rows from group {key!r}: only {self._size.get(key, 0)} present')
+        for col in self.columns:
+            stats = self._stats[col]
+            for key, nb, _, _, _, lo, hi in moments[col].itertuples(name=None):
+                if key not in stats or stats[key][0] < nb:
+                    raise ValueError(f'Cannot retract {int(nb)} {col!r} values from group {key!r}: '
+                                     f'only {stats[key][0] if key in stats else 0} present')
+                if not self.track_values and nb < stats[key][0] and (lo == stats[key][3] or hi == stats[key][4]):
+                    raise ValueError('Retracting a group minimum/maximum needs track_values=True')
+            for (*key, value), count in value_counts.get(col, {}).items():
+                key = key[0] if len(key) == 1 else tuple(key)
+                if self._values[col].get(key, {}).get(value, 0) < count:
+                    raise ValueError(f'Cannot retract {col}={value!r} from group {key!r}: it was never appended')
+
+    # 🟢 Index for the output tables, sorted like groupby(sort=True)
+    def _index(self, keys):
+        keys = sorted(keys)
+        if len(self.keys) == 1:
+            return pd.Index(keys, name=self.keys[0])
+        return pd.MultiIndex.from_tuples(keys, names=self.keys)
+
+    # 🟢 One statistic for one column → Series (same as groupby(keys)[col].<func>())
+    # Groups whose values in col are all NaN stay in the output, as in groupby
+    def stat(self, col, func):
+        stats = self._stats[col]
+        index = self._index(self._size)
+        empty = [0, 0, 0.0, np.nan, np.nan]
+        table = np.array([stats.get(key, empty) for key in index], dtype=object).reshape(len(index), 5)
+        n = table[:, 0].astype('float64')
+        if func == 'count':
+            values = table[:, 0].astype('int64')
+        elif func == 'sum':
+            values = table[:, 1].astype(self._dtypes[col] if self._dtypes[col].kind in 'iu' else 'float64')
+        elif func == 'mean':
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = table[:, 1].astype('float64') / n
+        elif func in ('var', 'std'):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values = np.where(n > 1, table[:, 2].astype('float64') / (n - 1), np.nan)
+            values = np.sqrt(values) if func == 'std' else values
+        elif func in ('min', 'max'):
+            dtype = self._dtypes[col] if (n > 0).all() else np.result_type(self._dtypes[col], np.float64)
+            values = table[:, 3 if func == 'min' else 4].astype(dtype)
+        else:
+            raise ValueError(f'Unsupported aggregation {func!r}')
+        return pd.Series(values, index=index, name=col)
+
+    # 🟢 groupby(keys).size()
+    def size(self):
+        index = self._index(self._size)
+        return pd.Series([self._size[key] for key in index], index=index, dtype='int64')
+
+    # 🟢 groupby(keys).agg(...) — str, list, dict or named aggregation like code08.py item 8
+    def agg(self, spec=None, **named):
+        if named:
+            return pd.DataFrame({out: self.stat(col, func) for out, (col, func) in named.items()})
+        if isinstance(spec, dict):
+            return pd.DataFrame({col: self.stat(col, func) for col, func in spec.items()})
+        col = self.columns[0]
+        if isinstance(spec, str):
+            return self.stat(col, spec)
+        return pd.DataFrame({func: self.stat(col, func) for func in spec})
+
+    # 🟢 Linear-interpolated quantile from a {value: count} dict (same as Series.quantile)
+    @staticmethod
+    def _quantile(counts, q):
+        values = np.array(sorted(counts))
+        cum = np.cumsum([counts[v] for v in values])
+        pos = (cum[-1] - 1) * q
+        lo = values[np.searchsorted(cum, np.floor(pos), side='right')]
+        hi = values[np.searchsorted(cum, np.ceil(pos), side='right')]
+        return lo + (hi - lo) * (pos - np.floor(pos))
+
+    # 🟢 groupby(keys)[col].describe()
+    def describe(self, col):
+        if not self.track_values:
+            raise ValueError('describe() needs track_values=True for the quartiles')
+        table = pd.DataFrame({
+            'count': self.stat(col, 'count').astype('float64'),
+            'mean': self.stat(col, 'mean'),
+            'std': self.stat(col, 'std'),
+            'min': self.stat(col, 'min').astype('float64'),
+        })
+        for label, q in [('25%', 0.25), ('50%', 0.5), ('75%', 0.75)]:
+            table[label] = [self._quantile(self._values[col][key], q) if key in self._values[col] else np.nan
+                            for key in table.index]
+        table['max'] = self.stat(col, 'max').astype('float64')
+        table.columns.name = None
+        return table
+
+
+if __name__ == '__main__':
+    # 🟢 Same dataset as code08.py, arriving in two batches
+    data = {
+        'Employee': ['Alice', 'Bob', 'Charlie', 'David', 'Eva', 'Frank', 'Grace', 'Helen'],
+        'Department': ['HR', 'HR', 'IT', 'IT', 'Finance', 'Finance', 'IT', 'HR'],
+        'Gender': ['F', 'M', 'M', 'M', 'F', 'M', 'F', 'F'],
+        'Salary': [50000, 52000, 60000, 58000, 62000, 61000, 63000, 51000],
+        'Bonus': [2000, 2500, 3000, 2800, 4000, 3500, 4100, 2300]
+    }
+    df = pd.DataFrame(data)
+
+    dept = OnlineGroupStats('Department', ['Salary', 'Bonus'])
+    dept.append(df.iloc[:5]).append(df.iloc[5:])
+
+    # 🟢 1. Mean salary per department
+    print(dept.stat('Salary', 'mean'))
+    # 🟢 2. mean / max / min
+    print(dept.agg(['mean', 'max', 'min']))
+    # 🟢 3. Salary mean + Bonus sum
+    print(dept.agg({'Salary': 'mean', 'Bonus': 'sum'}))
+    # 🟢 4. Department + Gender
+    by_gender = OnlineGroupStats(['Department', 'Gender'], 'Salary').append(df)
+    print(by_gender.stat('Salary', 'mean'))
+    # 🟢 5. / 6. reset_index and sort_values work on the returned Series as usual
+    print(dept.stat('Salary', 'mean').reset_index())
+    print(dept.stat('Salary', 'mean').sort_values(ascending=False))
+    # 🟢 7. Employees per department
+    print(dept.size())
+    # 🟢 8. Named aggregation
+    print(dept.agg(Avg_Sal=('Salary', 'mean'), Total_Bonus=('Bonus', 'sum')))
+    # 🟢 12. describe
+    print(dept.describe('Salary'))
+
+    # 🟢 Check against code08.py's full recompute, then retract Grace and check again
+    grouped = df.groupby('Department')
+    pd.testing.assert_frame_equal(dept.describe('Salary'), grouped['Salary'].describe())
+    pd.testing.assert_frame_equal(dept.agg(Avg_Sal=('Salary', 'mean'), Total_Bonus=('Bonus', 'sum')),
+                                  grouped.agg(Avg_Sal=('Salary', 'mean'), Total_Bonus=('Bonus', 'sum')))
+    dept.retract(df.iloc[[6]])
+    pd.testing.assert_frame_equal(dept.describe('Salary'),
+                                  df.drop(index=6).groupby('Department')['Salary'].describe())
+    print("✅ Incremental results match groupby() on the full table")
@@ -0,0 +1,159 @@
+# 🟢 Vectorized within-group standardize / normalize / rank for code08.py
+#
+# Item 11 of code08.py runs groupby(...).apply(lambda x: (x - x.mean()) / x.std()),
+# which calls a Python function once per group. Here every row gets an integer group
+# code once (groupby().ngroup()), the per-group moments are computed in one pass with
+# np.bincount, and the results are broadcast back with mean[codes] — the same idea as
+# transform('mean') in item 10. The output is always aligned with the input rows.
+
+import time
+
+import numpy as np
+import pandas as pd
+
+
+# 🟢 One integer code per row (-1 for rows whose key is NaN, like groupby's dropna)
+def group_codes(df, keys):
+    codes = df.groupby(keys, sort=False).ngroup().fillna(-1).to_numpy(dtype='int64')
+    n_groups = int(codes.max()) + 1 if len(codes) else 0
+    return codes, n_groups
+
+
+# 🟢 Shared setup: codes, float values and the mask of rows that take part
+def _prepare(df, keys, column):
+    codes, n_groups = group_codes(df, keys)
+    x = df[column].to_numpy(dtype='float64')
+    valid = (codes >= 0) & ~np.isnan(x)
+    return codes, n_groups, x, valid
+
+
+# 🟢 Per-group count, mean and sample std in two vectorized passes
+def group_moments(df, keys, column, ddof=1):
+    codes, n_groups, x, valid = _prepare(df, keys, column)
+    c = codes[valid]
+    n = np.bincount(c, minlength=n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.bincount(c, weights=x[valid], minlength=n_groups) / n
+        # Second pass on deviations is more accurate than sum(x**2) - n*mean**2
+        m2 = np.bincount(c, weights=(x[valid] - mean[c]) ** 2, minlength=n_groups)
+        std = np.sqrt(np.where(n > ddof, m2 / (n - ddof), np.nan))
+    return codes, x, valid, n, mean, std
+
+
+# 🟢 (x - group mean) / group std — replaces code08.py item 11
+def group_zscore(df, keys, column, ddof=1):
+    codes, x, valid, _, mean, std = group_moments(df, keys, column, ddof=ddof)
+    out = np.full(len(x), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[valid] = (x[valid] - mean[codes[valid]]) / std[codes[valid]]
+    return pd.Series(out, index=df.index, name=column)
+
+
+# 🟢 (x - group min) / (group max - group min)
+def group_minmax(df, keys, column):
+    codes, n_groups, x, valid = _prepare(df, keys, column)
+    lo = np.full(n_groups, np.inf)
+    hi = np.full(n_groups, -np.inf)
+    np.minimum.at(lo, codes[valid], x[valid])
+    np.maximum.at(hi, codes[valid], x[valid])
+    out = np.full(len(x), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        c = codes[valid]
+        out[valid] = (x[valid] - lo[c]) / (hi[c] - lo[c])
+    return pd.Series(out, index=df.index, name=column)
+
+
+# 🟢 Rank within group, same methods as groupby()[col].rank()
+def group_rank(df, keys, column, method='average', ascending=True, pct=False):
+    if method not in ('average', 'min', 'max', 'first', 'dense'):
+        raise ValueError(f"Unknown rank method {method!r}")
+    codes, n_groups, x, valid = _prepare(df, keys, column)
+    rows = np.flatnonzero(valid)
+    c, v = codes[rows], x[rows] if ascending else -x[rows]
+
+    # Sort by (group, value); a stable sort keeps original order inside ties for 'first'
+    order = np.lexsort((v, c))
+    rows, c, v = rows[order], c[order], v[order]
+
+    m = len(rows)
+    new_group = np.ones(m, dtype=bool)
+    new_group[1:] = c[1:] != c[:-1]
+    new_run = new_group.copy()
+    new_run[1:] |= v[1:] != v[:-1]
+
+    pos = np.arange(m)
+    group_start = np.maximum.accumulate(np.where(new_group, pos, 0))
+    pos_in_group = pos - group_start
+    run_id = np.cumsum(new_run) - 1
+    run_first = pos[new_run][run_id] - group_start
+    run_last = np.append(pos[new_run][1:] - 1, m - 1)[run_id] - group_start
+
+    if method == 'average':
+        ranks = (run_first + run_last) / 2 + 1
+    elif method == 'min':
+        ranks = run_first + 1.0
+    elif method == 'max':
+        ranks = run_last + 1.0
+    elif method == 'first':
+        ranks = pos_in_group + 1.0
+    else:   # dense
+        ranks = run_id - run_id[group_start] + 1.0
+
+    if pct and m:
+        # Divide by the group size (or the number of distinct values for 'dense')
+        starts = np.flatnonzero(new_group)
+        sizes = np.diff(np.append(starts, m))
+        denom = np.maximum.reduceat(ranks, starts) if method == 'dense' else sizes
+        ranks = ranks / np.repeat(denom, sizes)
+
+    out = np.full(len(x), np.nan)
+    out[rows] = ranks
+    return pd.Series(out, index=df.index, name=column)
+
+
+# 🟢 Benchmark: groupby().apply(lambda) vs group_zscore() for several group counts
+def benchmark(n_rows=1_000_000, group_counts=(10, 1_000, 100_000), seed=0):
+    rng = np.random.default_rng(seed)
+    results = []
+    for n_groups in group_counts:
+        df = pd.DataFrame({'Department': rng.integers(0, n_groups, n_rows),
+                           'Salary': rng.normal(60000, 5000, n_rows)})
+
+        start = time.perf_counter()
+        slow = df.groupby('Department', group_keys=False)['Salary'].apply(lambda x: (x - x.mean()) / x.std())
+        apply_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fast = group_zscore(df, 'Department', 'Salary')
+        vector_s = time.perf_counter() - start
+
+        results.append({'groups': n_groups, 'apply_s': apply_s, 'vectorized_s': vector_s,
+                        'speedup': apply_s / vector_s,
+                        'max_abs_diff': float(np.nanmax(np.abs(slow.sort_index() - fast)))})
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    # 🟢 Same dataset as code08.py
+    df = pd.DataFrame({
+        'Employee': ['Alice', 'Bob', 'Charlie', 'David', 'Eva', 'Frank', 'Grace', 'Helen'],
+        'Department': ['HR', 'HR', 'IT', 'IT', 'Finance', 'Finance', 'IT', 'HR'],
+        'Salary': [50000, 52000, 60000, 58000, 62000, 61000, 63000, 51000],
+    })
+    df['Z_Score_Salary'] = group_zscore(df, 'Department', 'Salary')
+    df['MinMax_Salary'] = group_minmax(df, 'Department', 'Salary')
+    df['Rank_Salary'] = group_rank(df, 'Department', 'Salary')
+    print(df)
+
+    # 🟢 Output:
+    #   Employee Department  Salary  Z_Score_Salary  MinMax_Salary  Rank_Salary
+    # 0    Alice         HR   50000       -1.000000            0.0          1.0
+    # 1      Bob         HR   52000        1.000000            1.0          3.0
+    # 2  Charlie         IT   60000       -0.132453            0.4          2.0
+    # 3    David         IT   58000       -0.927173            0.0          1.0
+    # 4      Eva    Finance   62000        0.707107            1.0          2.0
+    # 5    Frank    Finance   61000       -0.707107            0.0          1.0
+    # 6    Grace         IT   63000        1.059626            1.0          3.0
+    # 7    Helen         HR   51000        0.000000            0.5          2.0
+
+    print(benchmark(n_rows=200_000, group_counts=(10, 1_000, 50_000)))
@@ -0,0 +1,173 @@
+# 🟢 Reusable join index for the code09.py merge examples
+#
+# pd.merge(df1, df3, on='ID', how=...) re-hashes the right side on every call.
+# JoinIndex does that work once, through the shared KeyIndex (codekeys.py):
+#   - the right keys are factorized and the right rows grouped by key (one argsort)
+#   - lookups go through either a hash table (pd.Index engine, built once and cached)
+#     or a sorted key array + np.searchsorted
+#   - missing keys match each other, as in pd.merge
+# Every later inner/left/right/outer join against the same right table only probes.
+# For inputs that are already sorted by key, presorted=True skips the argsort
+# (sort-merge path).
+#
+# Row order follows pd.merge: inner/left keep left order, right keeps right order,
+# outer is sorted by key. A left row with several matches gets them in right order.
+# One pandas shortcut breaks that rule: a many-to-many inner join that happens to give
+# exactly len(left) rows comes out of pd.merge in another order (same rows, so compare
+# those after sort_values).
+
+import time
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import take
+from pandas.core.dtypes.cast import find_common_type     # same key dtype rule as pd.merge
+
+from codekeys import KeyIndex
+
+
+class JoinIndex(KeyIndex):
+
+    def __init__(self, right, on, method='hash', presorted=False):
+        if presorted and not right[on].is_monotonic_increasing:
+            raise ValueError(f'presorted=True but right[{on!r}] is not sorted')
+        # Sort-merge path for presorted keys: groups are contiguous runs, no argsort
+        super().__init__(right[on].to_numpy(), method=method, presorted=presorted)
+        self.right = right
+        self.on = on
+
+        # starts padded by one so an empty right table still indexes safely
+        self._bounds = np.append(self.starts, self.starts[-1])
+        self.unique_keys = bool((np.diff(self.starts) <= 1).all())
+
+    # 🟢 Matching (left row, right row) pairs, in left order
+    # keep_unmatched=True also emits (left row, -1) for left rows with no match
+    def _pairs(self, left_keys, keep_unmatched=False):
+        groups = self.lookup(left_keys)
+        matched = groups >= 0
+        g = np.maximum(groups, 0)
+        if self.unique_keys:
+            # Dimension-table case: at most one right row per key, no fan-out to expand
+            rows = np.arange(len(left_keys)) if keep_unmatched else np.flatnonzero(matched)
+            right_rows = np.where(matched[rows], self.order[self._bounds[g[rows]]], -1) \
+                if len(self.order) else np.full(len(rows), -1)
+            return rows, right_rows
+        lo = np.where(matched, self._bounds[g], 0)
+        counts = np.where(matched, self._bounds[g + 1] - lo, 0)
+        emit = np.where(matched, counts, 1) if keep_unmatched else counts
+        left_rows = np.repeat(np.arange(len(left_keys)), emit)
+        offsets = np.arange(len(left_rows)) - np.repeat(np.cumsum(emit) - emit, emit)
+        idx = np.repeat(lo, emit) + offsets
+        right_rows = self.order[idx] if len(self.order) else np.full(len(idx), -1)
+        if keep_unmatched:
+            right_rows = np.where(np.repeat(matched, emit), right_rows, -1)
+        return left_rows, right_rows
+
+    # 🟢 Same as pd.merge(left, self.right, on=self.on, how=how, suffixes=suffixes)
+    def merge(self, left, how='inner', suffixes=('_x', '_y')):
+        if how not in ('inner', 'left', 'right', 'outer'):
+            raise ValueError(f"Unknown join type {how!r}")
+        left_keys = left[self.on].to_numpy()
+        left_rows, right_rows = self._pairs(left_keys, keep_unmatched=how in ('left', 'outer'))
+
+        if how == 'right' or how == 'outer':
+            seen = np.zeros(len(self.right), dtype=bool)
+            seen[right_rows[right_rows >= 0]] = True
+            missing = np.flatnonzero(~seen)
+            left_rows = np.concatenate([left_rows, np.full(len(missing), -1)])
+            right_rows = np.concatenate([right_rows, missing])
+            if how == 'right':
+                order = np.argsort(right_rows, kind='stable')
+                left_rows, right_rows = left_rows[order], right_rows[order]
+
+        return self._assemble(left, left_rows, right_rows, how, suffixes)
+
+    # 🟢 Build the output frame: key, left columns, right columns
+    # A non-key column on both sides gets the suffixes, like pd.merge
+    def _assemble(self, left, left_rows, right_rows, how, suffixes):
+        right_key = self.right[self.on].to_numpy()
+        keys = np.where(left_rows >= 0,
+                        take(left[self.on].to_numpy(), left_rows, allow_fill=True),
+                        take(right_key, right_rows, allow_fill=True))
+        shared = (set(left.columns) & set(self.right.columns)) - {self.on}
+        out = {}
+        for col in left.columns:
+            name = f'{col}{suffixes[0]}' if col in shared else col
+            out[name] = keys if col == self.on else take(left[col].array, left_rows, allow_fill=True)
+        for col in self.right.columns:
+            if col != self.on:
+                name = f'{col}{suffixes[1]}' if col in shared else col
+                if name in out:
+                    raise ValueError(f'suffixes {suffixes} give duplicate column {name!r}')
+                out[name] = take(self.right[col].array, right_rows, allow_fill=True)
+        result = pd.DataFrame(out)
+        left_dtype, right_dtype = left[self.on].dtype, self.right[self.on].dtype
+        # inner/left keys all come from the left; right/outer mix both sides
+        keep_left = left_dtype == right_dtype or how in ('inner', 'left')
+        key_dtype = left_dtype if keep_left else find_common_type([left_dtype, right_dtype])
+        result[self.on] = result[self.on].astype(key_dtype)
+        if how == 'outer':
+            result = result.sort_values(self.on, kind='stable', ignore_index=True)
+        return result
+
+
+# 🟢 Sort-merge join for inputs that are already sorted by the key
+def merge_sorted(left, right, on, how='inner', suffixes=('_x', '_y')):
+    return JoinIndex(right, on, method='sorted', presorted=True).merge(left, how=how, suffixes=suffixes)
+
+
+# 🟢 Benchmark: pd.merge N times vs build once + N probes
+def benchmark(n_left=1_000_000, n_right=100_000, probes=10, how='left', method='hash', seed=0):
+    rng = np.random.default_rng(seed)
+    dim = pd.DataFrame({'ID': rng.permutation(n_right), 'Salary': rng.integers(30000, 90000, n_right)})
+    facts = pd.DataFrame({'ID': rng.integers(0, int(n_right * 1.1), n_left), 'Age': rng.integers(20, 60, n_left)})
+
+    start = time.perf_counter()
+    for _ in range(probes):
+        expected = pd.merge(facts, dim, on='ID', how=how)
+    merge_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = JoinIndex(dim, 'ID', method=method)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(probes):
+        result = index.merge(facts, how=how)
+    probe_s = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(result, expected)
+    return {'probes': probes, 'pd_merge_s': merge_s, 'build_s': build_s, 'probe_s': probe_s,
+            'amortized_per_join_s': (build_s + probe_s) / probes,
+            'speedup': merge_s / (build_s + probe_s)}
+
+
+if __name__ == '__main__':
+    # 🟢 Same frames as code09.py
+    df1 = pd.DataFrame({
+        'ID': [1, 2, 3],
+        'Name': ['Amit', 'Bina', 'Chetan'],
+        'Age': [23, 25, 24],
+        'City': ['Delhi', 'Mumbai', 'Pune']
+    })
+    df3 = pd.DataFrame({
+        'ID': [2, 3, 4],
+        'Salary': [50000, 60000, 70000],
+        'Experience': [2, 3, 4],
+        'Department': ['IT', 'HR', 'Sales']
+    })
+
+    index = JoinIndex(df3, 'ID')           # built once
+    for how in ['outer', 'inner', 'left', 'right']:
+        result = index.merge(df1, how=how)  # probed many times
+        pd.testing.assert_frame_equal(result, pd.merge(df1, df3, on='ID', how=how))
+        print(f"\n# {how} join:\n", result)
+
+    # Output (right join):
+    #    ID   Name   Age   City  Salary  Experience Department
+    # 0   2   Bina  25.0 Mumbai   50000           2         IT
+    # 1   3 Chetan  24.0   Pune   60000           3         HR
+    # 2   4    NaN   NaN    NaN   70000           4      Sales
+
+    print(merge_sorted(df1, df3, 'ID', how='outer'))
+    for n in (1, 10, 50):
+        print(benchmark(n_left=500_000, n_right=50_000, probes=n))
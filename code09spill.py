@@ -0,0 +1,209 @@
+# 🟢 Out-of-core concat and merge for code09.py inputs that exceed RAM
+#
+# pd.concat([df1, df2]) and pd.merge(df1, df3, how='outer') need both inputs in memory.
+# Here inputs are read in chunks and the result is streamed to an output CSV:
+#   - concat: chunks are appended to the output one by one
+#   - merge (grace hash join): both sides are split by hash(key) % n_partitions into
+#     temporary columnar files (Feather, or pickle without pyarrow). Rows with the same
+#     key always land in the same partition, so each partition pair is joined on its own
+#     with pd.merge and appended to the output. Peak memory ≈ one partition pair.
+#
+# The joined rows are the same as the in-memory pd.merge for every how, but they come out
+# partition by partition, so row order differs (sort both results to compare).
+# Integer columns from the side that can be missing are written as float, exactly as
+# pd.merge does once any row is unmatched, so every partition writes the same dtypes.
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (needed by DataFrame.to_feather / pd.read_feather)
+    SPILL_FORMAT = 'feather'
+except ImportError:  # pragma: no cover - depends on the environment
+    SPILL_FORMAT = 'pickle'
+
+
+# 🟢 Any input → iterator of DataFrame chunks (CSV path, DataFrame or iterable of frames)
+def _chunks(source, chunksize):
+    if isinstance(source, str):
+        yield from pd.read_csv(source, chunksize=chunksize)
+    elif isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+    else:
+        yield from source
+
+
+def _write_spill(frame, path):
+    if SPILL_FORMAT == 'feather':
+        frame.reset_index(drop=True).to_feather(path)
+    else:
+        frame.to_pickle(path)
+
+
+def _read_spill(path):
+    return pd.read_feather(path) if SPILL_FORMAT == 'feather' else pd.read_pickle(path)
+
+
+def _comparable(keys):
+    if pd.api.types.is_numeric_dtype(keys) and not pd.api.types.is_bool_dtype(keys):
+        # + 0.0 turns -0.0 into 0.0
+        return pd.Series(keys.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0, index=keys.index)
+    return keys
+
+
+# 🟢 Hash of key column(s); numbers are hashed as float64, so 5 and 5.0 land together
+# (as in pd.merge / drop_duplicates). Large ints may share a hash; that only costs a collision.
+def _key_hash(keys, hash_key='0123456789123456'):
+    if isinstance(keys, pd.DataFrame):
+        keys = pd.DataFrame({i: _comparable(keys.iloc[:, i]) for i in range(keys.shape[1])})
+    else:
+        keys = _comparable(keys)
+    return pd.util.hash_pandas_object(keys, index=False, hash_key=hash_key).to_numpy()
+
+
+# 🟢 Column names of a source without reading its rows (None for an iterable of frames)
+def _columns_of(source):
+    if isinstance(source, str):
+        return list(pd.read_csv(source, nrows=0).columns)
+    if isinstance(source, pd.DataFrame):
+        return list(source.columns)
+    return None
+
+
+# 🟢 Streaming pd.concat([...], ignore_index=True) → CSV
+# The header is the union of all columns (pd.concat's outer join), read up front from CSV
+# headers and frames; an iterable of frames that brings a new column after the header
+# is written cannot be streamed and raises.
+def concat_to_csv(sources, out_path, chunksize=1_000_000):
+    sources = list(sources)
+    columns = []
+    for names in map(_columns_of, sources):
+        columns += [c for c in names or [] if c not in columns]
+    header = True
+    with open(out_path, 'w', newline='') as out:
+        for source in sources:
+            for chunk in _chunks(source, chunksize):
+                new = [c for c in chunk.columns if c not in columns]
+                if new and not header:
+                    raise ValueError(f'columns {new} appear after the header was written; '
+                                     'pass them as a CSV path or DataFrame')
+                columns += new
+                # Same column order for every input (pd.concat aligns by name)
+                chunk.reindex(columns=columns).to_csv(out, index=False, header=header)
+                header = False
+        if header and columns:
+            pd.DataFrame(columns=columns).to_csv(out, index=False)
+    return out_path
+
+
+# 🟢 Split one input into n_partitions spill files per chunk
+def _partition(source, on, n_partitions, folder, side, chunksize):
+    files = [[] for _ in range(n_partitions)]
+    dtypes = None
+    for i, chunk in enumerate(_chunks(source, chunksize)):
+        dtypes = chunk.dtypes if dtypes is None else dtypes
+        part = _key_hash(chunk[on]) % np.uint64(n_partitions)
+        for p in np.unique(part):
+            path = os.path.join(folder, f'{side}-{p}-{i}.{SPILL_FORMAT}')
+            _write_spill(chunk[part == p], path)
+            files[p].append(path)
+    if dtypes is None:          # no rows: the schema still decides the output columns and dtypes
+        if isinstance(source, pd.DataFrame):
+            dtypes = source.dtypes
+        elif isinstance(source, str):
+            dtypes = pd.read_csv(source, nrows=0).dtypes
+        else:
+            raise ValueError(f'{side} input yielded no chunks, so its columns are unknown')
+    return files, dtypes
+
+
+def _load_partition(paths, dtypes):
+    if not paths:
+        return pd.DataFrame({name: pd.Series(dtype=dtype) for name, dtype in dtypes.items()})
+    return pd.concat([_read_spill(path) for path in paths], ignore_index=True)
+
+
+# 🟢 Grace hash join: pd.merge(left, right, on=on, how=how) → CSV, with bounded memory
+def merge_to_csv(left, right, on, how='inner', out_path='merged.csv',
+                 n_partitions=64, chunksize=1_000_000, tmp_dir=None):
+    if how not in ('inner', 'left', 'right', 'outer'):
+        raise ValueError(f"Unknown join type {how!r}")
+    folder = tempfile.mkdtemp(prefix='spill-', dir=tmp_dir)
+    try:
+        left_files, left_dtypes = _partition(left, on, n_partitions, folder, 'left', chunksize)
+        right_files, right_dtypes = _partition(right, on, n_partitions, folder, 'right', chunksize)
+
+        # Columns that can come back missing are upcast up front, like pd.merge does:
+        # ints to float64 (NaN), bools to object (True / NaN, not 1.0 / 0.0)
+        nullable = {}
+        for side_dtypes, missing in ((right_dtypes, ('left', 'outer')), (left_dtypes, ('right', 'outer'))):
+            if how in missing:
+                nullable.update({c: 'object' if t.kind == 'b' else 'float64'
+                                 for c, t in side_dtypes.items() if c != on and t.kind in 'iub'})
+
+        header = True
+        with open(out_path, 'w', newline='') as out:
+            for p in range(n_partitions):
+                if not left_files[p] and not right_files[p]:
+                    continue
+                lpart = _load_partition(left_files[p], left_dtypes)
+                rpart = _load_partition(right_files[p], right_dtypes)
+                joined = pd.merge(lpart, rpart, on=on, how=how)
+                if joined.empty and not header:
+                    continue
+                joined = joined.astype({c: t for c, t in nullable.items() if c in joined})
+                joined.to_csv(out, index=False, header=header)
+                header = False
+            if header:                  # no partition had rows: header only, like an empty pd.merge
+                pd.merge(_load_partition([], left_dtypes), _load_partition([], right_dtypes),
+                         on=on, how=how).to_csv(out, index=False)
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return out_path
+
+
+if __name__ == '__main__':
+    # 🟢 Same frames as code09.py
+    df1 = pd.DataFrame({
+        'ID': [1, 2, 3],
+        'Name': ['Amit', 'Bina', 'Chetan'],
+        'Age': [23, 25, 24],
+        'City': ['Delhi', 'Mumbai', 'Pune']
+    })
+    df2 = pd.DataFrame({
+        'ID': [4, 5, 6],
+        'Name': ['Divya', 'Eshan', 'Farah'],
+        'Age': [26, 27, 28],
+        'City': ['Jaipur', 'Kolkata', 'Chennai']
+    })
+    df3 = pd.DataFrame({
+        'ID': [2, 3, 4],
+        'Salary': [50000, 60000, 70000],
+        'Experience': [2, 3, 4],
+        'Department': ['IT', 'HR', 'Sales']
+    })
+
+    # 🟢 1. Vertical concatenation, streamed to disk
+    concat_to_csv([df1, df2], 'concat.csv', chunksize=2)
+    print(pd.read_csv('concat.csv'))
+
+    # 🟢 3.–6. Every join type, one row per chunk and 4 partitions
+    for how in ['outer', 'inner', 'left', 'right']:
+        merge_to_csv(df1, df3, on='ID', how=how, out_path=f'merge_{how}.csv',
+                     n_partitions=4, chunksize=1)
+        streamed = pd.read_csv(f'merge_{how}.csv').sort_values('ID', ignore_index=True)
+        expected = pd.merge(df1, df3, on='ID', how=how).sort_values('ID', ignore_index=True)
+        pd.testing.assert_frame_equal(streamed, expected, check_dtype=False)
+        print(f"\n# {how} join (streamed):\n", streamed)
+
+    # Output (outer join):
+    #    ID    Name   Age    City   Salary  Experience Department
+    # 0   1    Amit  23.0   Delhi      NaN         NaN        NaN
+    # 1   2    Bina  25.0  Mumbai  50000.0         2.0         IT
+    # 2   3  Chetan  24.0    Pune  60000.0         3.0         HR
+    # 3   4     NaN   NaN     NaN  70000.0         4.0      Sales
@@ -0,0 +1,120 @@
+# 🟢 Parallel (multi-core) text extraction for the code10.py Message column
+#
+# Builds on code10regex.py. The column is joined into one UTF-8 buffer and copied once
+# into shared memory. Each worker gets only (shared-memory name, byte range, first row),
+# attaches to the same buffer and scans its shard, so no Python strings are pickled
+# on the way in. Workers send back (row, match) arrays, which are offset by the shard's
+# first row and stitched back in order — the result is identical to the serial extract().
+# Workers split their shard back into rows and use the same matcher as extract() (Arrow RE2
+# or a row-safe scan), so no match crosses a row boundary. Text that contains the row
+# separator cannot be sharded this way and goes to the serial extract().
+#
+# Speedup depends on the cores available: with one core only the workers=1 row is measured,
+# which shows the cost of the process pool and shared memory, not the scaling.
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from code10regex import CODE10_PATTERNS, SEP, _join, _match_rows, _same, _to_column, compile_patterns, extract
+
+SEP_BYTE = ord(SEP)
+
+
+# 🟢 Split the buffer into n_shards byte ranges that start and end on row boundaries
+def _shard_ranges(raw, n_rows, n_shards):
+    seps = np.flatnonzero(np.frombuffer(raw, dtype=np.uint8) == SEP_BYTE)
+    row_starts = np.concatenate([[0], seps + 1])          # byte offset where each row starts
+    row_ends = np.concatenate([seps, [len(raw)]])          # byte offset where each row ends
+    cuts = np.linspace(0, n_rows, n_shards + 1).astype(np.int64)
+    ranges = []
+    for first, last in zip(cuts[:-1], cuts[1:]):
+        if last > first:
+            ranges.append((int(first), int(row_starts[first]), int(row_ends[last - 1])))
+    return ranges
+
+
+# 🟢 Worker: attach to shared memory, decode one shard, scan every pattern row by row
+def _scan_shard(shm_name, start, end, patterns):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        text = bytes(shm.buf[start:end]).decode('utf-8')
+    finally:
+        shm.close()
+    texts = pd.Series(text.split(SEP), dtype='str')
+    compiled = compile_patterns(patterns)
+    return {name: _match_rows(regex, mode, texts) for name, (regex, mode) in compiled.items()}
+
+
+# 🟢 Parallel version of code10regex.extract()
+def extract_parallel(series, patterns=CODE10_PATTERNS, workers=None, shards_per_worker=4):
+    workers = workers or os.cpu_count() or 1
+    compiled = compile_patterns(patterns)      # validate patterns before starting workers
+    try:
+        raw = _join(series).encode('utf-8')
+    except ValueError:                         # text contains the separator: no row boundaries
+        return extract(series, patterns)
+    n_rows = len(series)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(len(raw), 1))
+    try:
+        shm.buf[:len(raw)] = raw
+        ranges = _shard_ranges(raw, n_rows, workers * shards_per_worker)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_scan_shard, shm.name, start, end, patterns)
+                       for _, start, end in ranges]
+            parts = [future.result() for future in futures]   # submission order = row order
+    finally:
+        shm.close()
+        shm.unlink()
+
+    columns = {}
+    for name, (_, mode) in compiled.items():
+        rows = [part[name][0] + first for part, (first, _, _) in zip(parts, ranges)]
+        values = [part[name][1] for part in parts if part[name][1] is not None]   # None for counts
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        values = np.concatenate(values) if values else np.empty(0, dtype=object)
+        columns[name] = _to_column(rows, values, mode, n_rows, series.index, name)
+    return pd.DataFrame(columns, index=series.index)
+
+
+# 🟢 Benchmark: serial extract() vs extract_parallel() for 1..cpu_count workers
+def benchmark(messages, max_workers=None):
+    max_workers = max_workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    serial = extract(messages)
+    serial_s = time.perf_counter() - start
+
+    rows = []
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        result = extract_parallel(messages, workers=workers)
+        seconds = time.perf_counter() - start
+        rows.append({'workers': workers, 'seconds': seconds, 'speedup': serial_s / seconds,
+                     'identical': all(_same(serial[c], result[c]) for c in serial.columns)})
+    return serial_s, pd.DataFrame(rows)
+
+
+if __name__ == '__main__':
+    # 🟢 Same messages as code10.py, repeated to make the column large
+    base = [
+        'Hello, my contact is 9876543210.',
+        'My ID is riya_riya@outlook.com and alt is riya123@yahoo.in',
+        'Date of joining: 25-07-2025, phone: 8765432109',
+    ]
+    messages = pd.Series(base * 100_000)
+
+    serial_s, table = benchmark(messages)
+    print(f"Serial extract(): {serial_s:.2f}s")
+    print(table)
+
+    # 🟢 Output (shape of the table; timings depend on the machine):
+    #    workers  seconds  speedup  identical
+    # 0        1     ...      ...       True
+    # 1        2     ...      ...       True
+    # On a single core only the first row appears (measured: 0.87x, the pool + shared-memory
+    # overhead); the scaling with more workers has to be measured on a multi-core machine.
@@ -1,6 +1,7 @@
 # 📌 Step 1: Import necessary libraries
 import pandas as pd         # For data manipulation
 import numpy as np          # For numerical operations
+from csvcache import read_csv_cached  # Columnar cache so repeat runs skip CSV parsing
 
 # 📌 Step 2: Create and save the sample dataset as xyz1.csv
 # This simulates the real-world CSV with slightly dirty and varied data
@@ -26,7 +27,7 @@ print("✅ Dataset saved as xyz1.csv")    # Confirm save
 # ✅ Dataset saved as xyz1.csv
 
 # 📌 Step 3: Load the dataset from saved file
-df = pd.read_csv('xyz1.csv')            # Load data into DataFrame
+df = read_csv_cached('xyz1.csv')        # Load data into DataFrame (cached as Feather after first read)
 
 # Convert 'date' column to datetime for time-series operations later
 df['date'] = pd.to_datetime(df['date'])
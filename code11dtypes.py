@@ -0,0 +1,213 @@
+# 📌 Dtype-aware CSV loader
+# Step 9 of code11.py downcasts only after the full int64/float64/object frame is in memory.
+# Here the compact schema is inferred from a sample and handed straight to pd.read_csv,
+# so the wide frame never exists. The schema is saved next to the CSV (xyz1.csv.schema.json)
+# and reused on later runs.
+#
+# A sample that did not cover the whole file cannot promise that int8 holds every value
+# (pandas wraps 100000 to -96 without an error). Then the file is read in chunks: narrow
+# numeric columns are parsed at the reader's default dtype, range-checked and cast chunk by
+# chunk, so only one wide chunk exists at a time. A value that does not fit widens that
+# column (earlier chunks are cast up) and the saved schema is updated.
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+
+# 🟢 Where the schema lives: next to the CSV
+def schema_path(path):
+    return path + '.schema.json'
+
+
+# 🟢 Guess the most compact dtype for one sampled column
+def _compact_dtype(col, max_categories, category_ratio):
+    values = col.dropna()
+
+    if pd.api.types.is_integer_dtype(col):
+        # Same rule as pd.to_numeric(downcast='integer') in code11.py
+        return str(pd.to_numeric(col, downcast='integer').dtype), False
+
+    if pd.api.types.is_float_dtype(col):
+        # Same rule as pd.to_numeric(downcast='float') in code11.py
+        return str(pd.to_numeric(col, downcast='float').dtype), False
+
+    if pd.api.types.is_bool_dtype(col):
+        return 'bool', False
+
+    # Text column: is it a date?
+    if len(values):
+        try:
+            pd.to_datetime(values, format='ISO8601')
+            return 'datetime64[ns]', True
+        except (ValueError, TypeError):
+            pass
+
+    # Low-cardinality text → category (region, category, ...)
+    n_unique = values.nunique()
+    if len(values) and n_unique <= max_categories and n_unique / len(values) <= category_ratio:
+        return 'category', False
+
+    # High-cardinality text keeps the reader's default string dtype
+    return None, False
+
+
+# 🟢 Infer a compact schema from the first sample_rows rows
+def infer_schema(path, sample_rows=100_000, max_categories=1_000, category_ratio=0.5):
+    sample = pd.read_csv(path, nrows=sample_rows)
+    # The sample is the whole file when it came back shorter than asked for
+    complete = sample_rows is None or len(sample) < sample_rows
+    dtypes, parse_dates = {}, []
+    for name in sample.columns:
+        dtype, is_date = _compact_dtype(sample[name], max_categories, category_ratio)
+        if is_date:
+            parse_dates.append(name)
+        elif dtype is not None:
+            dtypes[name] = dtype
+    stat = os.stat(path)
+    return {'dtype': dtypes, 'parse_dates': parse_dates, 'sample_rows': sample_rows, 'complete': complete,
+            'source': {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}}
+
+
+# 🟢 Save / load the schema next to the CSV
+def save_schema(path, schema):
+    with open(schema_path(path), 'w') as f:
+        json.dump(schema, f, indent=2)
+
+
+def load_schema(path):
+    with open(schema_path(path)) as f:
+        return json.load(f)
+
+
+# 🟢 Was the schema inferred from every row of the file as it is now?
+def _covers_file(path, schema):
+    stat = os.stat(path)
+    source = schema.get('source', {})
+    return (schema.get('complete', False) and source.get('size') == stat.st_size
+            and source.get('mtime_ns') == stat.st_mtime_ns)
+
+
+def _is_narrow(dtype):
+    return dtype in ('int8', 'int16', 'int32', 'uint8', 'uint16', 'uint32', 'float32')
+
+
+# 🟢 Smallest dtype at least as wide as `target` that holds every value of the chunk column
+def _widen(col, target):
+    target = np.dtype(target)
+    if col.dtype.kind == 'f' or (target.kind == 'f' and col.dtype.kind in 'iu'):
+        if target.kind in 'iu':
+            return np.dtype('float64')          # NaN or fractions in an int column
+        top = np.nanmax(np.abs(col.to_numpy())) if len(col) else 0
+        return target if not top > np.finfo(target).max else np.dtype('float64')
+    if col.dtype.kind in 'iu' and len(col):
+        # Same rule as the sample: downcast the chunk's own range, never below the current dtype
+        needed = pd.to_numeric(pd.Series([col.min(), col.max()]), downcast='integer').dtype
+        return np.promote_types(target, needed)
+    if col.dtype.kind not in 'iuf' and len(col.dropna()):
+        raise ValueError(f'column {col.name!r} is no longer numeric; refresh the schema')
+    return target
+
+
+def _read_checked(path, schema, chunksize):
+    narrow = {name: dtype for name, dtype in schema['dtype'].items() if _is_narrow(dtype)}
+    others = {name: dtype for name, dtype in schema['dtype'].items() if name not in narrow}
+    pieces = []
+    for chunk in pd.read_csv(path, dtype=others, parse_dates=schema['parse_dates'], chunksize=chunksize):
+        for name, dtype in narrow.items():
+            narrow[name] = _widen(chunk[name], dtype)
+            chunk[name] = chunk[name].astype(narrow[name])
+        pieces.append(chunk)
+    if not pieces:
+        return pd.read_csv(path, dtype=schema['dtype'], parse_dates=schema['parse_dates']), schema
+
+    # Columns widened by a later chunk: cast the earlier chunks up (lossless)
+    for piece in pieces:
+        for name, dtype in narrow.items():
+            if piece[name].dtype != dtype:
+                piece[name] = piece[name].astype(dtype)
+    # Every chunk has its own categories; union them instead of falling back to object
+    categories = {name: union_categoricals([p[name] for p in pieces])
+                  for name, dtype in others.items() if dtype == 'category'}
+    df = pd.concat(pieces, ignore_index=True)
+    for name, values in categories.items():
+        df[name] = values
+    schema = {**schema, 'dtype': {**schema['dtype'], **{name: str(dtype) for name, dtype in narrow.items()}}}
+    return df, schema
+
+
+# 🟢 Read the CSV with the compact schema applied at parse time
+def read_csv_compact(path, refresh=False, chunksize=1_000_000, **infer_kwargs):
+    if refresh or not os.path.exists(schema_path(path)):
+        schema = infer_schema(path, **infer_kwargs)
+        save_schema(path, schema)
+    else:
+        schema = load_schema(path)
+
+    if _covers_file(path, schema):
+        # Every value was seen when the schema was made: the narrow dtypes are safe
+        return pd.read_csv(path, dtype=schema['dtype'], parse_dates=schema['parse_dates'])
+    df, checked = _read_checked(path, schema, chunksize)
+    if checked['dtype'] != schema['dtype']:
+        save_schema(path, checked)
+    return df
+
+
+# 🟢 Bytes saved per column, measured on a sample and scaled to the full row count
+def memory_report(path, schema=None, sample_rows=100_000, total_rows=None):
+    schema = schema or load_schema(path)
+    default = pd.read_csv(path, nrows=sample_rows)
+    compact = pd.read_csv(path, nrows=sample_rows, dtype=schema['dtype'],
+                          parse_dates=schema['parse_dates'])
+
+    report = pd.DataFrame({
+        'default_dtype': default.dtypes.astype(str),
+        'compact_dtype': compact.dtypes.astype(str),
+        'default_bytes': default.memory_usage(index=False, deep=True),
+        'compact_bytes': compact.memory_usage(index=False, deep=True),
+    })
+    if total_rows and len(default):
+        scale = total_rows / len(default)
+        report[['default_bytes', 'compact_bytes']] = (
+            report[['default_bytes', 'compact_bytes']] * scale).round().astype('int64')
+    report['saved_bytes'] = report['default_bytes'] - report['compact_bytes']
+    return report
+
+
+if __name__ == '__main__':
+    # 📌 Same sample dataset as code11.py
+    data = {
+        'id': [1, 2, 3, 4, 5, 6, 7, 8],
+        'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eva', 'Frank', 'Grace', None],
+        'category': ['A', 'B', 'A', 'B', 'A', 'A', 'B', 'A'],
+        'sales': [100, 200, 150, 180, 120, 130, 220, 110],
+        'region': ['East', 'West', 'East', 'West', 'East', 'West', 'East', 'East'],
+        'tags': ['promo,new', 'featured', 'promo', 'promo,old', 'new', '',
+                 'featured,promo', 'promo'],
+        'date': ['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04',
+                 '2023-01-05', '2023-01-06', '2023-01-07', '2023-01-08'],
+        'score': [90, 80, 70, None, 60, 75, 85, 55]
+    }
+    pd.DataFrame(data).to_csv('xyz1.csv', index=False)
+
+    df = read_csv_compact('xyz1.csv', refresh=True)
+    print("🔹 Compact dtypes (applied at read time):\n", df.dtypes)
+
+    # Output:
+    # 🔹 Compact dtypes (applied at read time):
+    # id                   int8
+    # name               object
+    # category         category
+    # sales               int16
+    # region           category
+    # tags               object
+    # date       datetime64[ns]
+    # score             float32
+    # dtype: object
+
+    print("\n🔹 Bytes saved per column:\n", memory_report('xyz1.csv'))
+    # Second run reads xyz1.csv.schema.json and skips inference
+    df = read_csv_compact('xyz1.csv')
@@ -0,0 +1,159 @@
+# 🟢 Vectorized split + explode for code11.py's comma-separated 'tags' column
+#
+# code11.py does df['tags'].str.split(',') (one Python list per row) and then
+# df.explode('tags') (flattens those lists again). Here the tags are split straight from
+# the string buffer in one pass, which yields three flat arrays:
+#   tags      — every tag, in row order            ('promo', 'new', 'featured', ...)
+#   offsets   — tags of row i are tags[offsets[i]:offsets[i + 1]]
+#   row_index — the row each tag came from (np.repeat of the row numbers)
+# explode_tags() then repeats the other columns with one take(row_index).
+# With pyarrow the split runs in Arrow's C++ kernels and the tags never become Python
+# objects; without it the column is joined once and split once in Python.
+#
+# Same rows as df.assign(tags=df['tags'].str.split(',')).explode('tags'): an empty string
+# gives one '' tag and a missing value gives one missing tag.
+# tags_one_hot() is the sparse version of df['tags'].str.get_dummies(','): one sparse 0/1
+# column per distinct tag, storing only the (row, tag) pairs that occur. Like get_dummies
+# on a 'str' column, an empty tag gets its own '' column (object columns drop it).
+
+import re
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+from pandas._libs.sparse import IntIndex     # positions of the stored values in a SparseArray
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+
+
+# 🟢 Arrow path: split_pattern gives a list array whose offsets are exactly what we need
+def _split_arrow(series, sep):
+    if hasattr(series.array, '__arrow_array__'):
+        values = pa.array(series.array)              # Arrow-backed 'str' column: no copy
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+    else:
+        values = pa.array(series.to_numpy(dtype=object), type=pa.string(), from_pandas=True)
+    missing = values.is_null().to_numpy(zero_copy_only=False)
+    lists = pc.split_pattern(pc.fill_null(values, ''), sep)
+    offsets = lists.offsets.to_numpy().astype(np.int64)
+    flat = lists.flatten()
+    if missing.any():
+        # A missing row was split as '' → exactly one tag, at offsets[row]; make it missing
+        null_at = np.zeros(len(flat), dtype=bool)
+        null_at[offsets[:-1][missing]] = True
+        flat = pc.if_else(pa.array(null_at), pa.scalar(None, flat.type), flat)
+    return pd.array(flat, dtype='str'), offsets
+
+
+# 🟢 Python path: ','.join(rows).split(',') splits every row at once, because a row with
+# k separators always contributes k + 1 tokens
+def _split_python(series, sep):
+    filled = series.fillna('').astype(str)
+    tokens = sep.join(filled.tolist()).split(sep) if len(filled) else []
+    counts = filled.str.count(re.escape(sep)).to_numpy() + 1
+    offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+    tags = pd.array(tokens, dtype='str')
+    missing = series.isna().to_numpy()
+    if missing.any():
+        tags[offsets[:-1][missing]] = np.nan
+    return tags, offsets
+
+
+def split_offsets(series, sep=',', engine=None):
+    engine = engine or ('arrow' if pa is not None else 'python')
+    tags, offsets = (_split_arrow if engine == 'arrow' else _split_python)(series, sep)
+    row_index = np.repeat(np.arange(len(series)), np.diff(offsets))
+    return tags, offsets, row_index
+
+
+# 🟢 Same rows as df.assign(col=df[col].str.split(sep)).explode(col)
+def explode_tags(df, column='tags', sep=',', engine=None):
+    tags, _, row_index = split_offsets(df[column], sep, engine)
+    exploded = df.drop(columns=column).take(row_index)
+    exploded.insert(df.columns.get_loc(column), column, tags)
+    return exploded
+
+
+# 🟢 Sparse df[col].str.get_dummies(sep): one SparseDtype column per distinct tag
+def tags_one_hot(series, sep=',', engine=None):
+    tags, _, row_index = split_offsets(series, sep, engine)
+    known = ~pd.isna(tags)
+    codes, names = pd.factorize(tags[known], sort=True)
+    rows = row_index[known]
+    # One (row, tag) pair per occurrence; a tag repeated inside a row still counts once
+    pairs = np.unique(codes.astype(np.int64) * len(series) + rows)
+    pair_codes, pair_rows = pairs // max(len(series), 1), pairs % max(len(series), 1)
+    bounds = np.searchsorted(pair_codes, np.arange(len(names) + 1))
+    columns = {}
+    for k, name in enumerate(names):
+        hit = pair_rows[bounds[k]:bounds[k + 1]]
+        columns[name] = _sparse_column(hit, len(series))
+    return pd.DataFrame(columns, index=series.index)
+
+
+def _sparse_column(rows, n):
+    return pd.arrays.SparseArray(np.ones(len(rows), dtype=np.int64),
+                                 sparse_index=IntIndex(n, rows.astype(np.int32)), fill_value=0)
+
+
+# 🟢 Benchmark: str.split + explode vs explode_tags, and get_dummies vs tags_one_hot
+def benchmark(n_rows=2_000_000, n_tags=200, seed=0):
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f'tag{i}' for i in range(n_tags)], dtype=object)
+    counts = rng.integers(0, 4, n_rows)
+    flat = vocab[rng.integers(0, n_tags, counts.sum())]
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+    df = pd.DataFrame({'id': np.arange(n_rows),
+                       'tags': pd.Series([','.join(flat[a:b]) for a, b in zip(bounds[:-1], bounds[1:])], dtype='str')})
+
+    def measure(fn):
+        tracemalloc.start()
+        start = time.perf_counter()
+        out = fn()
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return out, {'seconds': seconds, 'python_peak_mb': peak / 2 ** 20}
+
+    results = {}
+    expected, results['split+explode'] = measure(lambda: df.assign(tags=df['tags'].str.split(',')).explode('tags'))
+    for engine in (['arrow'] if pa is not None else []) + ['python']:
+        got, results[f'explode_tags[{engine}]'] = measure(lambda: explode_tags(df, 'tags', engine=engine))
+        pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+    sample = df.iloc[:200_000]
+    dummies, results['get_dummies (200k rows)'] = measure(lambda: sample['tags'].str.get_dummies(','))
+    sparse, results['tags_one_hot (200k rows)'] = measure(lambda: tags_one_hot(sample['tags']))
+    assert (sparse.sparse.to_dense().to_numpy() == dummies.to_numpy()).all()
+    results['one_hot_mb'] = {'dense': dummies.memory_usage().sum() / 2 ** 20,
+                             'sparse': sparse.memory_usage().sum() / 2 ** 20}
+    return results
+
+
+if __name__ == '__main__':
+    # 🟢 Same rows as code11.py
+    df = pd.DataFrame({
+        'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eva', 'Frank', 'Grace', None],
+        'tags': ['promo,new', 'featured', 'promo', 'promo,old', 'new', '',
+                 'featured,promo', 'promo'],
+    })
+    df_exploded = explode_tags(df, 'tags')
+    print("🔹 After explode_tags():\n", df_exploded.head(6))
+
+    # Output:
+    # 🔹 After explode_tags():
+    #        name      tags
+    # 0    Alice     promo
+    # 0    Alice       new
+    # 1      Bob  featured
+    # 2  Charlie     promo
+    # 3    David     promo
+    # 3    David       old
+
+    print("\n🔹 Sparse one-hot tags:\n", tags_one_hot(df['tags']))
+    print(benchmark())
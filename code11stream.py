@@ -0,0 +1,214 @@
+# 📌 Streaming version of the code11.py pipeline
+# Reads xyz1.csv in bounded chunks so peak memory stays fixed no matter how big the file is.
+#
+# Pass 1 walks the chunks once and keeps only small running aggregates:
+#   - MultiIndex groupby sums (step 1)
+#   - weekly sales sums (step 6)
+#   - missing-value counts and the score mean (step 7)
+#   - the widest downcast dtype seen per column (step 9)
+# Pass 2 walks the chunks again and streams the row-level results
+# (explode, melt, query, rolling, cleaned frame) straight to CSV files.
+
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+VALUE_VARS = ['sales', 'score']
+
+
+# 🟢 Helper: pick the widest of the dtypes seen across chunks
+def _widest(dtypes):
+    return np.result_type(*dtypes) if dtypes else None
+
+
+# 🟢 Helper: append a chunk to a CSV, writing the header only once
+def _append_csv(frame, path):
+    frame.to_csv(path, mode='a', index=False, header=not os.path.exists(path))
+
+
+# 🟢 Helper: same per-chunk preparation as Step 3 of code11.py
+def _read_chunks(path, chunksize):
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        chunk['date'] = pd.to_datetime(chunk['date'])
+        yield chunk
+
+
+# 🟢 Pass 1: aggregates only (memory is O(groups + weeks), not O(rows))
+def collect_aggregates(path, chunksize=100_000):
+    grouped = None
+    weekly = None
+    missing = None
+    score_sum, score_count = 0.0, 0
+    downcast = {'sales': [], 'score': []}
+    value_dtypes = []
+    sales_dtypes = []
+
+    for chunk in _read_chunks(path, chunksize):
+        # ✅ 1. Partial MultiIndex sums, merged by adding on the index
+        part = chunk.groupby(['region', 'category'])[['sales']].sum()
+        grouped = part if grouped is None else grouped.add(part, fill_value=0)
+
+        # ✅ 6. Partial weekly sums (week bins are anchored, so they line up across chunks)
+        week = chunk.set_index('date')['sales'].resample('W').sum()
+        weekly = week if weekly is None else weekly.add(week, fill_value=0)
+
+        # ✅ 7. Missing-value counts (region_code is derived from region, so it mirrors it)
+        counts = chunk.isnull().sum()
+        counts['region_code'] = chunk['region'].map({'East': 'E', 'West': 'W'}).isnull().sum()
+        missing = counts if missing is None else missing + counts
+        score_sum += chunk['score'].sum()
+        score_count += chunk['score'].count()
+
+        # ✅ 9. Downcast target per chunk, on the rows that survive dropna(subset=['name'])
+        kept = chunk.dropna(subset=['name'])
+        downcast['sales'].append(pd.to_numeric(kept['sales'], downcast='integer').dtype)
+        downcast['score'].append(pd.to_numeric(kept['score'].dropna(), downcast='float').dtype)
+        value_dtypes.append(np.result_type(*chunk[VALUE_VARS].dtypes))
+        sales_dtypes.append(chunk['sales'].dtype)
+
+    score_mean = score_sum / score_count if score_count else np.nan
+    # The fill value itself must also fit the chosen float dtype
+    downcast['score'].append(pd.to_numeric(pd.Series([score_mean]), downcast='float').dtype)
+
+    # add(fill_value=0) upcasts to float when indexes differ, so restore the sales dtype
+    sales_dtype = _widest(sales_dtypes)
+    grouped = grouped.sort_index().astype({'sales': sales_dtype})
+    weekly = weekly.sort_index().astype(sales_dtype)
+    # resample() emits empty weeks as 0, so fill the gaps between chunk ranges the same way
+    full_range = pd.date_range(weekly.index.min(), weekly.index.max(), freq='W')
+    weekly = weekly.reindex(full_range, fill_value=0).astype(weekly.dtype)
+    weekly.index.name = 'date'
+
+    return {
+        'grouped': grouped,
+        'weekly_sales': weekly,
+        'missing': missing,
+        'score_mean': score_mean,
+        'downcast': {col: _widest(dtypes) for col, dtypes in downcast.items()},
+        'value_dtype': _widest(value_dtypes),
+    }
+
+
+# 🟢 Pass 2: stream row-level results to CSV files in out_dir
+def stream_rows(path, out_dir, aggregates, chunksize=100_000, window=3):
+    os.makedirs(out_dir, exist_ok=True)
+    outputs = {name: os.path.join(out_dir, f'{name}.csv')
+               for name in ['exploded', 'melted', 'query', 'rolling', 'clean']}
+    melted_parts = {var: os.path.join(out_dir, f'melted_{var}.part') for var in VALUE_VARS}
+    for file in list(outputs.values()) + list(melted_parts.values()):
+        if os.path.exists(file):
+            os.remove(file)
+
+    tail = pd.Series(dtype='float64')   # last (window - 1) scores carried into the next chunk
+
+    for chunk in _read_chunks(path, chunksize):
+        # ✅ 2. explode() — the split/explode is row-local, so chunk order is preserved
+        chunk['tags'] = chunk['tags'].str.split(',')
+        _append_csv(chunk.explode('tags'), outputs['exploded'])
+
+        # ✅ 3. melt() — the in-memory result lists every 'sales' row before every 'score' row,
+        # so each value_var goes to its own part file and they are joined at the end
+        for var in VALUE_VARS:
+            part = pd.melt(chunk, id_vars=['id', 'name'], value_vars=[var],
+                           var_name='metric', value_name='value')
+            part['value'] = part['value'].astype(aggregates['value_dtype'])
+            _append_csv(part, melted_parts[var])
+
+        # ✅ 4. query()
+        _append_csv(chunk.query("sales > 100 and region == 'East'"), outputs['query'])
+
+        # ✅ 5. map() and replace()
+        chunk['region_code'] = chunk['region'].map({'East': 'E', 'West': 'W'})
+        chunk['category'] = chunk['category'].replace({'A': 'Alpha', 'B': 'Beta'})
+
+        # ✅ 6. Rolling mean — prepend the previous chunk's tail so windows span chunk edges
+        scores = pd.concat([tail, chunk.set_index('date')['score'].astype('float64')])
+        rolled = scores.rolling(window).mean().iloc[len(tail):]
+        _append_csv(rolled.rename('score').reset_index(), outputs['rolling'])
+        tail = scores.iloc[len(scores) - (window - 1):] if window > 1 else scores.iloc[:0]
+
+        # ✅ 7. fillna with the global mean from pass 1, then dropna
+        chunk['score'] = chunk['score'].fillna(aggregates['score_mean'])
+        chunk = chunk.dropna(subset=['name'])
+
+        # ✅ 8. pipe() — lowercase column names
+        chunk.columns = [col.lower() for col in chunk.columns]
+
+        # ✅ 9. Downcast to the dtype chosen over the whole file, so every chunk agrees
+        for col, dtype in aggregates['downcast'].items():
+            chunk[col] = chunk[col].astype(dtype)
+        _append_csv(chunk, outputs['clean'])
+
+    # Join the melt parts: all 'sales' rows first, then all 'score' rows
+    with open(outputs['melted'], 'w') as out:
+        for i, var in enumerate(VALUE_VARS):
+            if not os.path.exists(melted_parts[var]):
+                continue
+            with open(melted_parts[var]) as part:
+                header = part.readline()
+                if i == 0 or out.tell() == 0:
+                    out.write(header)
+                shutil.copyfileobj(part, out)
+            os.remove(melted_parts[var])
+
+    return outputs
+
+
+# 🟢 Run the whole streaming pipeline
+def run_streaming(path='xyz1.csv', out_dir='xyz1_stream', chunksize=100_000, window=3):
+    aggregates = collect_aggregates(path, chunksize=chunksize)
+    aggregates['outputs'] = stream_rows(path, out_dir, aggregates, chunksize=chunksize, window=window)
+    return aggregates
+
+
+if __name__ == '__main__':
+    # 📌 Same sample dataset as code11.py, processed 3 rows at a time
+    data = {
+        'id': [1, 2, 3, 4, 5, 6, 7, 8],
+        'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eva', 'Frank', 'Grace', None],
+        'category': ['A', 'B', 'A', 'B', 'A', 'A', 'B', 'A'],
+        'sales': [100, 200, 150, 180, 120, 130, 220, 110],
+        'region': ['East', 'West', 'East', 'West', 'East', 'West', 'East', 'East'],
+        'tags': ['promo,new', 'featured', 'promo', 'promo,old', 'new', '',
+                 'featured,promo', 'promo'],
+        'date': ['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04',
+                 '2023-01-05', '2023-01-06', '2023-01-07', '2023-01-08'],
+        'score': [90, 80, 70, None, 60, 75, 85, 55]
+    }
+    pd.DataFrame(data).to_csv('xyz1.csv', index=False)
+
+    result = run_streaming('xyz1.csv', out_dir='xyz1_stream', chunksize=3)
+    print("🔹 1. MultiIndex Grouped Result:\n", result['grouped'])
+    print("\n🔹 6. Weekly Sales:\n", result['weekly_sales'])
+    print("\n🔹 7. Missing values per column:\n", result['missing'])
+    print("\n🔹 9. Downcast dtypes:", result['downcast'])
+
+    # Output:
+    # 🔹 1. MultiIndex Grouped Result:
+    #                  sales
+    # region category
+    # East   A          480
+    #        B          220
+    # West   A          130
+    #        B          380
+    #
+    # 🔹 6. Weekly Sales:
+    # date
+    # 2023-01-01     100
+    # 2023-01-08    1110
+    # Freq: W-SUN, Name: sales, dtype: int64
+    #
+    # 🔹 9. Downcast dtypes: {'sales': dtype('int16'), 'score': dtype('float32')}
+
+    # 📌 Check against the in-memory version of code11.py
+    df = pd.read_csv('xyz1.csv')
+    df['date'] = pd.to_datetime(df['date'])
+    pd.testing.assert_frame_equal(result['grouped'], df.groupby(['region', 'category'])[['sales']].sum())
+    pd.testing.assert_series_equal(result['weekly_sales'],
+                                   df.set_index('date')['sales'].resample('W').sum(),
+                                   check_freq=False)
+    rolling = pd.read_csv(result['outputs']['rolling'])['score']
+    np.testing.assert_allclose(rolling, df['score'].rolling(3).mean(), equal_nan=True)
+    print("\n✅ Streaming result matches the in-memory pipeline")
@@ -0,0 +1,400 @@
+# 🟢 Batched resample / rolling kernels for code11.py step 6, many series at once
+#
+# code11.py runs df['sales'].resample('W').sum() and df['score'].rolling(3).mean() on one
+# series. For thousands of series the data comes in long format (series_id, timestamp, value)
+# and calling resample / rolling once per series spends most of its time in per-call overhead.
+# Here all series are sorted once by (series_id, timestamp) into one flat array, and every
+# kernel is a handful of whole-array numpy passes, O(n) in the number of rows:
+#
+# resample_many()  — each row gets an integer bin number; output slot = series offset + bin.
+#                    sum / mean / count with np.bincount, std with a second centered pass,
+#                    min / max with fmin/fmax.reduceat over the (already sorted) slots.
+#                    Empty bins inside a series are kept, like resample (sum 0, mean NaN).
+# rolling_many()   — integer windows like rolling(3). The rows are cut into blocks of
+#                    `window` rows with a running sum / min / max forwards and backwards inside
+#                    each block; every window is then one block tail + one block head, so each
+#                    row costs O(1) whatever the window (van Herk / Gil-Werman for min / max).
+#                    The first window - 1 rows of a series get a running sum / min / max.
+#                    Sums never run further than one block, so they do not drift over long
+#                    series. std keeps running (count, mean, M2) instead of sums of squares
+#                    (Welford's update inside a block, Chan's merge of block tail + head), so
+#                    a level shift far away from the window cannot cancel out its variance.
+# NaN values are skipped like pandas does: min_periods counts non-NaN values in the window.
+# workers > 1 splits the rows at series boundaries and runs the shards in forked processes.
+#
+# Supported resample frequencies: fixed ones that divide a day ('D', 'h', '15min', ...),
+# weekly ('W', 'W-MON', ...) and month end ('ME'). Tz-aware timestamps are binned on the
+# local calendar like resample does, and the labels keep the timezone.
+
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+DAY_NS = 86_400 * 10 ** 9
+HOWS = ('sum', 'mean', 'count', 'min', 'max', 'std')
+
+_SHARED = {}        # arrays inherited by forked workers
+
+
+# =========================
+# Preparation: one sorted flat array for all series
+# =========================
+
+# ts is UTC for tz-aware timestamps; local is ts + shift (wall-clock time), or None when naive
+def _prepare(long, id_col, time_col, value_col):
+    codes, labels = pd.factorize(long[id_col], sort=True)
+    stamps = pd.to_datetime(long[time_col])
+    ts = stamps.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    tz = stamps.dt.tz
+    shift = None if tz is None else stamps.dt.tz_localize(None).to_numpy(dtype='datetime64[ns]').view(np.int64) - ts
+    values = long[value_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    # Rows without a series id or timestamp are left out, like groupby / resample do
+    keep = (codes >= 0) & (ts != np.iinfo(np.int64).min)
+    rows = np.arange(len(codes))
+    if not keep.all():
+        rows = rows[keep]
+        codes, ts, values = codes[rows], ts[rows], values[rows]
+        shift = None if shift is None else shift[rows]
+    in_order = (np.all(codes[1:] >= codes[:-1])
+                and np.all((ts[1:] >= ts[:-1]) | (codes[1:] != codes[:-1])))
+    if not in_order:
+        order = np.lexsort((ts, codes))
+        codes, ts, values, rows = codes[order], ts[order], values[order], rows[order]
+        shift = None if shift is None else shift[order]
+    return codes, ts, values, labels, rows, (tz, shift)
+
+
+def _segments(codes):
+    starts = np.concatenate([[0], np.flatnonzero(codes[1:] != codes[:-1]) + 1]).astype(np.int64)
+    lengths = np.diff(np.append(starts, len(codes)))
+    return starts, lengths
+
+
+# 🟢 Row ranges of about n / workers rows, cut only where a new series starts
+def _shards(codes, workers):
+    starts, _ = _segments(codes)
+    cuts = np.unique(starts[np.searchsorted(starts, np.linspace(0, len(codes), workers + 1)[1:-1])])
+    bounds = np.concatenate([[0], cuts, [len(codes)]]).astype(np.int64)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def _run_shard(kernel, lo, hi, kwargs):
+    codes, ts, values = (_SHARED[name][lo:hi] for name in ('codes', 'ts', 'values'))
+    return kernel(codes, ts, values, **kwargs)
+
+
+def _run(kernel, codes, ts, values, workers, **kwargs):
+    if not len(codes):
+        return [kernel(codes, ts, values, **kwargs)]
+    shards = _shards(codes, workers) if workers > 1 else [(0, len(codes))]
+    if len(shards) == 1 or 'fork' not in mp.get_all_start_methods():
+        return [kernel(codes[lo:hi], ts[lo:hi], values[lo:hi], **kwargs) for lo, hi in shards]
+    _SHARED.update(codes=codes, ts=ts, values=values)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context('fork')) as pool:
+            futures = [pool.submit(_run_shard, kernel, lo, hi, kwargs) for lo, hi in shards]
+            return [f.result() for f in futures]
+    finally:
+        _SHARED.clear()
+
+
+# =========================
+# Resample
+# =========================
+
+# 🟢 Integer bin per timestamp, and the function turning bins back into resample's labels
+def _bins(ts, freq):
+    offset = pd.tseries.frequencies.to_offset(freq)
+    if isinstance(offset, (pd.offsets.Tick, pd.offsets.Day)):      # Day is not a Tick in pandas 3
+        step = int(offset.nanos)
+        if DAY_NS % step:
+            raise ValueError(f'{freq!r}: fixed frequencies must divide one day')
+        return ts // step, lambda bins: (bins * step).astype('datetime64[ns]')
+    if isinstance(offset, pd.offsets.Week) and offset.weekday is not None and offset.n == 1:
+        # Bin (previous anchor day, anchor day], labelled with the anchor day; 1970-01-01 was a Thursday
+        day = ts // DAY_NS
+        label_day = day + (offset.weekday - (day + 3)) % 7
+        residue = (offset.weekday - 3) % 7
+        return label_day // 7, lambda bins: ((bins * 7 + residue) * DAY_NS).astype('datetime64[ns]')
+    if isinstance(offset, pd.offsets.MonthEnd) and offset.n == 1:
+        month = ts.astype('datetime64[ns]').astype('datetime64[M]').astype(np.int64)
+        return month, lambda bins: ((bins + 1).astype('datetime64[M]').astype('datetime64[D]')
+                                    - np.timedelta64(1, 'D')).astype('datetime64[ns]')
+    raise ValueError(f'{freq!r}: supported are fixed frequencies dividing a day, weekly and month end')
+
+
+# 🟢 Bins for tz-aware timestamps, the way resample cuts them: days, weeks and months follow the
+# local calendar (a DST day has 23 or 25 hours); shorter fixed bins are cut in UTC, which
+# gives pandas' local-midnight bins whenever every UTC offset in the data is a multiple of
+# the bin. Labels are returned in the data's timezone.
+def _local_bins(ts, shift, tz, freq):
+    offset = pd.tseries.frequencies.to_offset(freq)
+    if isinstance(offset, (pd.offsets.Tick, pd.offsets.Day)) and int(offset.nanos) < DAY_NS:
+        step = int(offset.nanos)
+        if len(shift) and (shift % step).any():
+            raise ValueError(f'{freq!r}: UTC offsets of {tz} are not whole bins; convert the timestamps first')
+        bins, to_label = _bins(ts, freq)
+        return bins, lambda b: pd.DatetimeIndex(to_label(b)).tz_localize('UTC').tz_convert(tz)
+    bins, to_label = _bins(ts + shift, freq)
+    return bins, lambda b: pd.DatetimeIndex(to_label(b)).tz_localize(tz)
+
+
+def _resample_kernel(codes, bins, values, how):
+    starts, lengths = _segments(codes)
+    if not len(codes):
+        return codes, bins, values
+    ends = starts + lengths - 1
+    first, span = bins[starts], bins[ends] - bins[starts] + 1
+    out_start = np.concatenate([[0], np.cumsum(span)])
+    seg = np.repeat(np.arange(len(starts)), lengths)
+    slot = out_start[seg] + bins - first[seg]
+    size = int(out_start[-1])
+
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    count = np.bincount(slot, weights=valid, minlength=size)
+    if how == 'count':
+        out = count.astype(np.int64)
+    elif how in ('sum', 'mean', 'std'):
+        total = np.bincount(slot, weights=filled, minlength=size)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            out = total if how == 'sum' else total / count
+            if how == 'std':
+                deviation = np.where(valid, values - out[slot], 0.0)
+                squares = np.bincount(slot, weights=deviation * deviation, minlength=size)
+                out = np.sqrt(squares / (count - 1))
+                out[count < 2] = np.nan
+    else:
+        # slot never decreases, so every slot's rows are one run
+        runs = np.concatenate([[0], np.flatnonzero(np.diff(slot)) + 1])
+        out = np.full(size, np.nan)
+        out[slot[runs]] = (np.fmin if how == 'min' else np.fmax).reduceat(values, runs)
+
+    out_codes = np.repeat(codes[starts], span)
+    out_bins = np.repeat(first, span) + (np.arange(size) - np.repeat(out_start[:-1], span))
+    return out_codes, out_bins, out
+
+
+# 🟢 Same values as long.set_index(time_col).groupby(id_col)[value_col].resample(freq).agg(how),
+# as a long frame (id_col, time_col, value_col)
+def resample_many(long, freq='W', how='sum', id_col='series_id', time_col='timestamp',
+                  value_col='value', workers=1):
+    if how not in HOWS:
+        raise ValueError(f'how must be one of {HOWS}')
+    codes, ts, values, labels, _, (tz, shift) = _prepare(long, id_col, time_col, value_col)
+    if tz is None:
+        bins, to_label = _bins(ts, freq)
+    else:
+        bins, to_label = _local_bins(ts, shift, tz, freq)
+    parts = _run(_resample_kernel, codes, bins, values, workers, how=how)
+    out_codes, out_bins, out = (np.concatenate(p) for p in zip(*parts))
+    return pd.DataFrame({id_col: labels.take(out_codes), time_col: to_label(out_bins), value_col: out})
+
+
+# =========================
+# Rolling
+# =========================
+
+# 🟢 Running results inside blocks of `window` rows, forwards (prefix) and backwards (suffix).
+# The window ending at column c < window - 1 of block b is the tail of block b - 1
+# (suffix, from column c + 1) plus the head of block b (prefix, up to column c); at the
+# last column it is exactly block b.
+def _blocks(x, window, accumulate, combine, fill):
+    n = len(x)
+    blocks = -(-n // window)
+    if n % window:
+        grid = np.full(blocks * window, fill)
+        grid[:n] = x
+    else:
+        grid = x
+    grid = grid.reshape(blocks, window)
+    prefix = accumulate(grid, axis=1)
+    suffix = accumulate(grid[:, ::-1], axis=1)[:, ::-1]
+    out = prefix
+    out[1:, :window - 1] = combine(suffix[:-1, 1:], prefix[1:, :window - 1])
+    return out.ravel()[:n]
+
+
+# 🟢 The first window - 1 rows of every series, as a (series, window - 1) grid of positions
+def _head_rows(starts, lengths, window):
+    offsets = np.arange(window - 1)
+    return starts[:, None] + offsets, offsets < lengths[:, None]
+
+
+# 🟢 Sliding sum / min / max over `window` rows that never crosses into the previous series:
+# the blocks give every full window, the head rows of a series get a running sum / min / max
+def _rolling(x, starts, lengths, window, accumulate, combine, fill):
+    out = _blocks(x, window, accumulate, combine, fill)
+    if window > 1:
+        rows, inside = _head_rows(starts, lengths, window)
+        head = np.where(inside, x[np.minimum(rows, len(x) - 1)], fill)
+        out[rows[inside]] = accumulate(head, axis=1)[inside]
+    return out
+
+
+def _rolling_sum(x, starts, lengths, window):
+    return _rolling(x, starts, lengths, window, np.cumsum, np.add, 0.0)
+
+
+# 🟢 Running (count, mean, M2) along axis 1 with Welford's update; NaN is skipped.
+# One vectorized step per column, so window steps over n / window rows each.
+def _moments_accumulate(grid):
+    columns = np.ascontiguousarray(grid.T)          # one contiguous row per step
+    n, mean, m2 = (np.zeros(columns.shape) for _ in range(3))
+    cn, cmean, cm2 = (np.zeros(columns.shape[1]) for _ in range(3))
+    for j, x in enumerate(columns):
+        ok = ~np.isnan(x)
+        cn += ok
+        d = np.where(ok, x - cmean, 0.0)
+        cmean += d / np.maximum(cn, 1)
+        cm2 += np.where(ok, d * (x - cmean), 0.0)
+        n[j], mean[j], m2[j] = cn, cmean, cm2
+    return n.T, mean.T, m2.T
+
+
+# 🟢 Chan's merge of two (count, mean, M2) sets; an empty side leaves the other unchanged
+def _moments_combine(a, b):
+    (na, ma, m2a), (nb, mb, m2b) = a, b
+    n = na + nb
+    share = nb / np.maximum(n, 1)
+    delta = mb - ma
+    return n, ma + delta * share, m2a + m2b + delta * delta * na * share
+
+
+# 🟢 (count, M2) of every window: the same block tail + head scheme as _blocks / _rolling
+def _rolling_moments(x, starts, lengths, window):
+    n = len(x)
+    blocks = -(-n // window)
+    grid = np.full(blocks * window, np.nan)
+    grid[:n] = x
+    grid = grid.reshape(blocks, window)
+    out = _moments_accumulate(grid)
+    if window > 1:
+        suffix = [m[:, ::-1] for m in _moments_accumulate(grid[:, ::-1])]
+        merged = _moments_combine([m[:-1, 1:] for m in suffix], [m[1:, :window - 1] for m in out])
+        for o, m in zip(out, merged):
+            o[1:, :window - 1] = m
+    out = [o.ravel()[:n] for o in out]
+    if window > 1:
+        rows, inside = _head_rows(starts, lengths, window)
+        head = np.where(inside, x[np.minimum(rows, n - 1)], np.nan)
+        for o, m in zip(out, _moments_accumulate(head)):
+            o[rows[inside]] = m[inside]
+    return out[0], out[2]
+
+
+def _rolling_kernel(codes, ts, values, window, how, min_periods):
+    starts, lengths = _segments(codes)
+    if not len(codes):
+        return values
+    valid = ~np.isnan(values)
+    # Rows in each window (NaN or not), and the non-NaN values among them
+    rows = np.full(len(codes), float(window))
+    if window > 1:
+        head, inside = _head_rows(starts, lengths, window)
+        rows[head[inside]] = np.broadcast_to(np.arange(1, window, dtype=np.float64), head.shape)[inside]
+    all_valid = valid.all()
+    count = rows if all_valid else _rolling_sum(valid.astype(np.float64), starts, lengths, window)
+    if how == 'count':
+        # rolling().count() applies min_periods to the rows in the window, NaN or not
+        out = count.copy()
+        out[rows < min_periods] = np.nan
+        return out
+
+    filled = values if all_valid else np.where(valid, values, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if how == 'sum':
+            out = _rolling_sum(filled, starts, lengths, window)
+        elif how == 'mean':
+            out = _rolling_sum(filled, starts, lengths, window) / count
+        elif how == 'std':
+            _, m2 = _rolling_moments(values, starts, lengths, window)
+            out = np.sqrt(m2 / (count - 1))
+            out[count < 2] = np.nan
+        else:
+            fn = np.fmin if how == 'min' else np.fmax
+            out = _rolling(values, starts, lengths, window, fn.accumulate, fn, np.nan)
+    out[count < max(min_periods, 1 if how != 'sum' else 0)] = np.nan
+    return out
+
+
+# 🟢 Same values as long.sort_values([id_col, time_col]).groupby(id_col)[value_col]
+# .rolling(window, min_periods).agg(how), returned as a Series aligned with long's rows
+def rolling_many(long, window, how='mean', min_periods=None, id_col='series_id', time_col='timestamp',
+                 value_col='value', workers=1):
+    if how not in HOWS:
+        raise ValueError(f'how must be one of {HOWS}')
+    if not isinstance(window, (int, np.integer)) or window < 1:
+        raise ValueError('window must be a positive number of rows')
+    min_periods = window if min_periods is None else min_periods
+    if not 0 <= min_periods <= window:
+        raise ValueError(f'min_periods {min_periods} must be between 0 and window {window}')
+    codes, ts, values, _, rows, _ = _prepare(long, id_col, time_col, value_col)
+    parts = _run(_rolling_kernel, codes, ts, values, workers, window=int(window), how=how,
+                 min_periods=min_periods)
+    out = np.full(len(long), np.nan)
+    out[rows] = np.concatenate(parts)
+    return pd.Series(out, index=long.index, name=value_col)
+
+
+# =========================
+# 🟢 Benchmark: one pandas call per series vs the batched kernels
+# =========================
+
+def benchmark(shapes=((1_000, 10_000), (20_000, 500)), window=60, workers=None, seed=0):
+    rng = np.random.default_rng(seed)
+    workers = workers or os.cpu_count() or 1
+    results = {}
+    for n_series, n_points in shapes:
+        ts = pd.date_range('2023-01-01', periods=n_points, freq='min').to_numpy()
+        long = pd.DataFrame({'series_id': np.repeat(np.arange(n_series), n_points),
+                             'timestamp': np.tile(ts, n_series),
+                             'value': rng.normal(100, 10, n_series * n_points)})
+        long.loc[rng.random(len(long)) < 0.01, 'value'] = np.nan
+        timings = {}
+
+        start = time.perf_counter()
+        expected = [s.set_index('timestamp')['value'].resample('h').sum() for _, s in long.groupby('series_id')]
+        timings['per-series resample'] = time.perf_counter() - start
+        for w in sorted({1, workers}):
+            start = time.perf_counter()
+            got = resample_many(long, 'h', 'sum', workers=w)
+            timings[f'resample_many[workers={w}]'] = time.perf_counter() - start
+        assert np.allclose(got['value'].to_numpy(), np.concatenate([e.to_numpy() for e in expected]))
+
+        start = time.perf_counter()
+        expected = pd.concat([s['value'].rolling(window).mean() for _, s in long.groupby('series_id')])
+        timings['per-series rolling'] = time.perf_counter() - start
+        for w in sorted({1, workers}):
+            start = time.perf_counter()
+            got = rolling_many(long, window, 'mean', workers=w)
+            timings[f'rolling_many[workers={w}]'] = time.perf_counter() - start
+        assert np.allclose(got.to_numpy(), expected.to_numpy(), equal_nan=True)
+        results[f'{n_series} series x {n_points} minutes'] = timings
+    return results
+
+
+if __name__ == '__main__':
+    # 🟢 code11.py's sales / score by date, plus a second series
+    dates = pd.date_range('2023-01-01', periods=8, freq='D')
+    long = pd.DataFrame({
+        'series_id': ['sales'] * 8 + ['score'] * 8,
+        'timestamp': list(dates) * 2,
+        'value': [100, 200, 150, 180, 120, 130, 220, 110, 90, 80, 70, None, 60, 75, 85, 55],
+    })
+    print(resample_many(long, 'W', 'sum'))
+
+    # Output:
+    #   series_id  timestamp   value
+    # 0     sales 2023-01-01   100.0
+    # 1     sales 2023-01-08  1110.0
+    # 2     score 2023-01-01    90.0
+    # 3     score 2023-01-08   425.0
+
+    long['rolling_3'] = rolling_many(long, 3, 'mean')
+    print(long[long['series_id'] == 'score'].head(6))
+    print(benchmark())
@@ -0,0 +1,162 @@
+# =========================
+# 🟢 Lazy copy-on-write copies instead of code5.py's eager df1.copy()
+# =========================
+#
+# df_copy = df1.copy() duplicates every column up front, even when the copy only gets one
+# new column. With copy-on-write (always on in pandas 3, opt-in via
+# pd.options.mode.copy_on_write in pandas 2) a shallow copy shares every column buffer
+# with the original, and pandas copies a column only when one side writes to it.
+# code5.py's guarantee still holds: writes to the copy never show up in the original.
+#
+# lazy_copy(df)        → shallow copy when copy-on-write is active, otherwise df.copy()
+# copy_stats(a, b)     → how many bytes of b are still shared with a vs actually copied,
+#                        found by comparing the memory addresses of each column's buffers
+# CopyTracker          → counts the copied bytes of every copy made inside a with block
+
+import time
+
+import numpy as np
+import pandas as pd
+
+
+def _cow_enabled():
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except KeyError:  # pragma: no cover - pandas < 2 has no copy-on-write
+        return False
+
+
+def lazy_copy(df):
+    return df.copy(deep=False) if _cow_enabled() else df.copy()
+
+
+# 🟢 Memory ranges (start, end) behind one column
+def _buffers(series):
+    arr = series.array
+    if hasattr(arr, '_pa_array'):                        # pyarrow-backed (pandas 3 'str')
+        return [(buf.address, buf.address + buf.size)
+                for chunk in arr._pa_array.chunks for buf in chunk.buffers() if buf is not None]
+    parts = [getattr(arr, name, None) for name in ('_ndarray', '_data', '_mask', '_codes')]
+    parts = [p for p in parts if isinstance(p, np.ndarray)] or [np.asarray(arr)]
+    ranges = []
+    for p in parts:
+        start = p.__array_interface__['data'][0]
+        ranges.append((start, start + p.nbytes))
+    return ranges
+
+
+def _shares_buffer(a, b):
+    return any(s1 < e2 and s2 < e1 for s1, e1 in _buffers(a) for s2, e2 in _buffers(b))
+
+
+def copy_stats(original, copy):
+    stats = {'shared_bytes': 0, 'copied_bytes': 0, 'new_bytes': 0, 'copied_columns': []}
+    for col in copy.columns:
+        nbytes = int(copy[col].array.nbytes)
+        if col not in original.columns:
+            stats['new_bytes'] += nbytes
+        elif _shares_buffer(original[col], copy[col]):
+            stats['shared_bytes'] += nbytes
+        else:
+            stats['copied_bytes'] += nbytes
+            stats['copied_columns'].append(col)
+    # What df.copy() would have copied up front
+    stats['eager_copy_bytes'] = int(sum(original[col].array.nbytes for col in original.columns))
+    return stats
+
+
+# =========================
+# 🟢 Counts bytes actually copied by every lazy copy made inside the block.
+# The counts are taken when the block ends, after all writes, and the frames are released.
+# =========================
+
+class CopyTracker:
+
+    def __init__(self):
+        self._pairs = []
+        self.totals = None
+
+    def copy(self, df):
+        result = lazy_copy(df)
+        self._pairs.append((df, result))
+        return result
+
+    def report(self):
+        totals = {'copies': len(self._pairs), 'shared_bytes': 0, 'copied_bytes': 0,
+                  'new_bytes': 0, 'eager_copy_bytes': 0}
+        for original, copy in self._pairs:
+            stats = copy_stats(original, copy)
+            for key in ('shared_bytes', 'copied_bytes', 'new_bytes', 'eager_copy_bytes'):
+                totals[key] += stats[key]
+        return totals
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.totals = self.report()
+        self._pairs = []
+        return False
+
+
+# =========================
+# 🟢 Benchmark: eager copy vs lazy copy of a wide frame that gets one write and one new column
+# =========================
+
+def benchmark(n_rows=200_000, n_cols=100, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.random((n_rows, n_cols)), columns=[f'c{i}' for i in range(n_cols)])
+    results = {}
+    for name, make_copy in [('copy()', pd.DataFrame.copy), ('lazy_copy()', lazy_copy)]:
+        start = time.perf_counter()
+        copy = make_copy(df)
+        copy.loc[0, 'c0'] = -1.0
+        copy['Copied'] = True
+        seconds = time.perf_counter() - start
+        stats = copy_stats(df, copy)
+        results[name] = {'seconds': seconds, 'copied_mb': stats['copied_bytes'] / 2 ** 20,
+                         'shared_mb': stats['shared_bytes'] / 2 ** 20}
+        assert df.loc[0, 'c0'] != -1.0 and 'Copied' not in df
+    return results
+
+
+if __name__ == '__main__':
+    # 🟢 Same df1 as code5.py at the copy() step
+    df1 = pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve'],
+        'Score': [85, 75, 90, 76, 92],
+        'Grade': ['B', 'C', 'A', 'B', 'A'],
+        'Bonus': [90, 80, 95, 81, 97],
+        'DoubleScore': [170, 150, 180, 152, 184],
+    }).set_index('Name')
+
+    with CopyTracker() as tracker:
+        df_copy = tracker.copy(df1)
+        df_copy['Copied'] = True              # new column: nothing of df1 is copied
+        df_copy.loc['Bob', 'Bonus'] = 0       # write: only the Bonus column is copied
+    print(df_copy)
+    print("\n# Original df1 unchanged:")
+    print(df1)
+    print("\n#", tracker.totals)
+
+    # Output:
+    #          Score Grade  Bonus  DoubleScore  Copied
+    # Name
+    # Alice       85     B     90          170    True
+    # Bob         75     C      0          150    True
+    # Charlie     90     A     95          180    True
+    # David       76     B     81          152    True
+    # Eve         92     A     97          184    True
+    #
+    # # Original df1 unchanged:
+    #          Score Grade  Bonus  DoubleScore
+    # Name
+    # Alice       85     B     90          170
+    # Bob         75     C     80          150
+    # ...
+    #
+    # # {'copies': 1, 'shared_bytes': 125, 'copied_bytes': 40, 'new_bytes': 5, 'eager_copy_bytes': 165}
+
+    print(benchmark())
@@ -0,0 +1,164 @@
+# =========================
+# 🟢 Reproducible streaming, stratified and parallel sampling for code5.py's sample()
+# =========================
+#
+# df1.sample(n=2, random_state=1) needs the whole frame in memory. Here every row gets a
+# random key computed from (seed, shard number, row number in the shard) with a
+# splitmix64 hash, and the sample is the n rows with the smallest keys. That is a
+# reservoir sample (every row equally likely, without replacement), but:
+#   - only n candidate rows are kept while the chunks stream past
+#   - the key of a row does not depend on chunk size, worker count or processing order,
+#     so the same seed always gives the same sample, serial or parallel
+#   - per-shard samples merge by keeping the smallest keys again
+# A shard is one input (CSV path, DataFrame or iterable of frames). The result is a
+# different random draw than DataFrame.sample with the same seed.
+#
+# sample_rows(sources, n, seed)                     → simple random sample
+# sample_rows(sources, quotas, seed, by='Grade')    → stratified: quotas = {'A': 1, 'B': 2}
+#                                                     or one int for every stratum
+# sample_parallel(...)                              → same result, shards in worker processes
+#                                                     (shards must be CSV paths or DataFrames)
+
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from code09spill import _chunks
+
+GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix(z):
+    with np.errstate(over='ignore'):
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+# 🟢 One uint64 key per row, from (seed, shard, row number inside the shard)
+def row_keys(seed, shard, rows):
+    with np.errstate(over='ignore'):
+        base = _mix(_mix(np.uint64(seed)) ^ (np.uint64(shard) + np.uint64(1)) * GOLDEN)
+        return _mix(base + np.asarray(rows, dtype=np.uint64) * GOLDEN)
+
+
+# 🟢 Keep the rows with the smallest keys: n overall, or quotas[stratum] per stratum
+def _smallest(frame, keys, quotas, by):
+    if by is None:
+        if len(frame) <= quotas:
+            return frame, keys
+        keep = np.argpartition(keys, quotas - 1)[:quotas]
+    else:
+        order = np.argsort(keys, kind='stable')
+        strata = pd.Series(frame[by].to_numpy()[order])
+        rank = strata.groupby(strata, dropna=False).cumcount().to_numpy()
+        limit = quotas if isinstance(quotas, int) else strata.map(quotas).fillna(0).to_numpy()
+        keep = order[rank < limit]
+    return frame.iloc[keep], keys[keep]
+
+
+def _merge(parts, quotas, by):
+    parts = [p for p in parts if len(p[0])]
+    if not parts:
+        return None
+    frame = pd.concat([p[0] for p in parts])
+    keys = np.concatenate([p[1] for p in parts])
+    return _smallest(frame, keys, quotas, by)
+
+
+# 🟢 Candidates of one shard, streamed chunk by chunk
+def _sample_shard(shard, source, quotas, seed, by, chunksize):
+    state, row = None, 0
+    for chunk in _chunks(source, chunksize):
+        keys = row_keys(seed, shard, np.arange(row, row + len(chunk)))
+        row += len(chunk)
+        candidate = _smallest(chunk, keys, quotas, by)
+        state = _merge([state, candidate] if state is not None else [candidate], quotas, by)
+    return state
+
+
+def _finish(state):
+    if state is None:
+        return pd.DataFrame()
+    frame, keys = state
+    return frame.iloc[np.argsort(keys, kind='stable')]
+
+
+def _as_list(sources):
+    return list(sources) if isinstance(sources, (list, tuple)) else [sources]
+
+
+def sample_rows(sources, quotas, seed=0, by=None, chunksize=1_000_000):
+    states = [_sample_shard(i, source, quotas, seed, by, chunksize) for i, source in enumerate(_as_list(sources))]
+    return _finish(_merge([s for s in states if s is not None], quotas, by))
+
+
+def sample_parallel(sources, quotas, seed=0, by=None, chunksize=1_000_000, workers=None):
+    sources = _as_list(sources)
+    workers = workers or os.cpu_count() or 1
+    context = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+    run = partial(_sample_shard, quotas=quotas, seed=seed, by=by, chunksize=chunksize)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        states = list(pool.map(run, range(len(sources)), sources))
+    return _finish(_merge([s for s in states if s is not None], quotas, by))
+
+
+# =========================
+# 🟢 Throughput: read everything + DataFrame.sample vs streaming sample vs parallel shards
+# =========================
+
+def benchmark(folder='.', n_rows=2_000_000, n_shards=4, n=1_000, seed=0):
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(n_shards):
+        rows = n_rows // n_shards
+        shard = pd.DataFrame({'Name': [f'student{i}_{k}' for k in range(rows)],
+                              'Score': rng.integers(0, 100, rows),
+                              'Grade': rng.choice(['A', 'B', 'C'], rows, p=[0.1, 0.3, 0.6])})
+        paths.append(os.path.join(folder, f'sample_shard_{i}.csv'))
+        shard.to_csv(paths[-1], index=False)
+
+    timings = {}
+    start = time.perf_counter()
+    pd.concat([pd.read_csv(p) for p in paths], ignore_index=True).sample(n=n, random_state=seed)
+    timings['load_then_sample'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    serial = sample_rows(paths, n, seed=seed, chunksize=250_000)
+    timings['streaming'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = sample_parallel(paths, n, seed=seed, chunksize=250_000)
+    timings['parallel'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sample_rows(paths, {'A': n // 3, 'B': n // 3, 'C': n // 3}, seed=seed, by='Grade', chunksize=250_000)
+    timings['stratified'] = time.perf_counter() - start
+
+    assert serial.equals(parallel)
+    return {name: {'seconds': s, 'rows_per_second': n_rows / s} for name, s in timings.items()}
+
+
+if __name__ == '__main__':
+    # 🟢 Same df1 as code5.py
+    df1 = pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve'],
+        'Score': [85, 75, 90, 76, 92],
+        'Grade': ['B', 'C', 'A', 'B', 'A']
+    }).set_index('Name')
+
+    print("# Random sample of 2 rows:")
+    print(sample_rows(df1, 2, seed=1))
+    print("# Same sample, read two rows at a time:")
+    print(sample_rows(df1, 2, seed=1, chunksize=2))
+    print("# One row per Grade:")
+    print(sample_rows(df1, 1, seed=1, by='Grade'))
+    print("# Two shards in parallel (other shard numbers, so a different draw):")
+    print(sample_parallel([df1.iloc[:3], df1.iloc[3:]], 2, seed=1, workers=2))
+
+    print(benchmark())
@@ -0,0 +1,120 @@
+# =========================
+# 🟢 Batch cell updates for code5.py's df1.loc['Bob', 'Score'] = 75
+# =========================
+#
+# A correction job that runs df.loc[label, column] = value in a Python loop resolves the
+# label again on every call and goes through pandas' setitem machinery each time.
+# CellUpdater takes (label, column, value) arrays instead:
+#   1. all labels are resolved to row positions at once (LookupIndex, built once per frame)
+#   2. writes are grouped by column
+#   3. for a (row, column) written more than once only the LAST value is kept, exactly
+#      like the sequential loop (last write wins)
+#   4. each column gets one vectorized df.iloc[rows, col] = values scatter write
+# Like .loc, a label that appears several times in the index updates all of its rows.
+# Unknown labels or columns raise KeyError (the loop would silently add new rows/columns).
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from codelookup import LookupIndex
+
+
+class CellUpdater:
+
+    def __init__(self, df):
+        self.df = df
+        self.index = LookupIndex(df.index)
+
+    # 🟢 Rows for each update; labels that occur several times in the index fan out
+    def _rows(self, labels):
+        missing = self.index.lookup(labels) < 0
+        if missing.any():
+            raise KeyError(list(np.asarray(labels)[missing][:5]))
+        if self.index.is_unique:
+            return np.arange(len(labels)), self.index.positions(labels)
+        return self.index.all_positions(labels)
+
+    def update(self, labels, columns, values):
+        labels = np.asarray(labels)
+        columns = np.asarray(columns)
+        # A plain list may mix types across columns (70, 'A+'), so keep it as objects
+        values = values if isinstance(values, np.ndarray) else np.asarray(values, dtype=object)
+        if not len(labels) == len(columns) == len(values):
+            raise ValueError('labels, columns and values must have the same length')
+        unknown = set(pd.unique(columns)) - set(self.df.columns)
+        if unknown:
+            raise KeyError(sorted(unknown))
+
+        update_no, rows = self._rows(labels)
+        for column in pd.unique(columns):
+            mine = columns[update_no] == column
+            col_rows, col_values = rows[mine], values[update_no[mine]]
+            # Last write wins: keep the last occurrence of each row
+            _, last_from_end = np.unique(col_rows[::-1], return_index=True)
+            keep = len(col_rows) - 1 - last_from_end
+            col_values = col_values[keep]
+            if col_values.dtype == object:
+                col_values = pd.Series(col_values, dtype=object).infer_objects().to_numpy()
+            self.df.iloc[col_rows[keep], self.df.columns.get_loc(column)] = col_values
+        return self.df
+
+
+# 🟢 One-off shortcut: update_cells(df1, ['Bob'], ['Score'], [75])
+def update_cells(df, labels, columns, values):
+    return CellUpdater(df).update(labels, columns, values)
+
+
+# =========================
+# 🟢 Benchmark: scalar .loc loop vs one batch (same result, repeated keys included)
+# =========================
+
+def benchmark(n_rows=1_000_000, n_updates=50_000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'Name': [f'student{i}' for i in range(n_rows)],
+                       'Score': rng.integers(0, 100, n_rows),
+                       'Bonus': rng.integers(0, 10, n_rows)}).set_index('Name')
+    labels = df.index.to_numpy()[rng.integers(0, n_rows // 10, n_updates)]   # many repeats
+    columns = rng.choice(['Score', 'Bonus'], n_updates)
+    values = rng.integers(0, 100, n_updates)
+
+    looped = df.copy()
+    start = time.perf_counter()
+    for label, column, value in zip(labels, columns, values):
+        looped.loc[label, column] = value
+    loop_s = time.perf_counter() - start
+
+    batched = df.copy()
+    start = time.perf_counter()
+    updater = CellUpdater(batched)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    updater.update(labels, columns, values)
+    batch_s = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(looped, batched)
+    return {'updates': n_updates, 'loc_loop_s': loop_s, 'index_build_s': build_s, 'batch_s': batch_s,
+            'speedup': loop_s / (build_s + batch_s)}
+
+
+if __name__ == '__main__':
+    # 🟢 Same df1 as code5.py, indexed by Name
+    df1 = pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve'],
+        'Score': [85, 67, 90, 76, 92],
+        'Grade': ['B', 'C', 'A', 'B', 'A']
+    }).set_index('Name')
+
+    # Bob's Score is written twice: the last value (75) wins, like two .loc assignments
+    update_cells(df1, ['Bob', 'Eve', 'Bob'], ['Score', 'Grade', 'Score'], [70, 'A+', 75])
+    print(df1)
+    #         Score Grade
+    # Name
+    # Alice      85     B
+    # Bob        75     C
+    # Charlie    90     A
+    # David      76     B
+    # Eve        92    A+
+
+    print(benchmark())
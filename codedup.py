@@ -0,0 +1,181 @@
+# =========================
+# Hash-based duplicate detection index for code.py
+# duplicated() / drop_duplicates() / unique() / nunique() from one cached fingerprint
+# =========================
+#
+# code.py calls df1.duplicated(), df1.duplicated(subset='Name'), drop_duplicates() and
+# drop_duplicates(subset='Name', keep='first') separately, and each call re-hashes every
+# row. DuplicateIndex hashes each row (or key subset) once into a 64-bit fingerprint
+# with pd.util.hash_pandas_object and caches it. Every later query only works on the
+# uint64 fingerprints, and append(batch) hashes just the new rows.
+#
+# Two different rows share a 64-bit fingerprint with probability about n² / 2⁶⁵
+# (≈ 3% at a billion rows), so use an exact drop_duplicates() where that matters.
+# Batches should keep the same dtypes: 1 and 1.0 hash differently.
+
+import numpy as np
+import pandas as pd
+
+
+# =========================
+# Set of seen fingerprints with amortized O(batch) inserts
+# Lookups go through a pd.Index hash table; new fingerprints wait in a small pending
+# Index and are merged into the main one only when pending grows past half its size.
+# =========================
+
+class _SeenSet:
+
+    def __init__(self):
+        self._main = pd.Index(np.empty(0, dtype=np.uint64))
+        self._pending = []
+        self._pending_index = None
+
+    def __len__(self):
+        return len(self._main) + sum(len(p) for p in self._pending)
+
+    def contains(self, fps):
+        found = self._main.get_indexer(fps) >= 0
+        if self._pending:
+            if self._pending_index is None:
+                self._pending_index = pd.Index(np.concatenate(self._pending))
+            found |= self._pending_index.get_indexer(fps) >= 0
+        return found
+
+    def add(self, fps):
+        if not len(fps):
+            return
+        self._pending.append(fps)
+        self._pending_index = None
+        if sum(len(p) for p in self._pending) * 2 > len(self._main):
+            self._main = pd.Index(np.concatenate([self._main.to_numpy()] + self._pending))
+            self._pending = []
+
+
+class DuplicateIndex:
+
+    def __init__(self, df=None):
+        self._batches = []
+        self._frame = None
+        self._fps = {}     # subset → list of uint64 arrays, one per batch
+        self._seen = {}    # subset → _SeenSet of every fingerprint so far
+        if df is not None:
+            self.append(df)
+
+    # =========================
+    # Helpers
+    # =========================
+
+    def _subset(self, subset, columns=None):
+        if subset is None:
+            return tuple(self._batches[0].columns if columns is None else columns)
+        return (subset,) if isinstance(subset, str) else tuple(subset)
+
+    @staticmethod
+    def _hash(batch, cols):
+        return pd.util.hash_pandas_object(batch[list(cols)], index=False).to_numpy()
+
+    # Hash every stored batch for a subset the first time it is asked for
+    def _ensure(self, cols):
+        if cols not in self._fps:
+            self._fps[cols] = [self._hash(batch, cols) for batch in self._batches]
+            seen = _SeenSet()
+            if self._fps[cols]:
+                seen.add(pd.unique(np.concatenate(self._fps[cols])))
+            self._seen[cols] = seen
+
+    @property
+    def frame(self):
+        if self._frame is None:
+            self._frame = self._batches[0] if len(self._batches) == 1 else pd.concat(self._batches)
+        return self._frame
+
+    # =========================
+    # Fingerprints for a subset, hashed once and cached
+    # =========================
+
+    def fingerprints(self, subset=None):
+        cols = self._subset(subset)
+        self._ensure(cols)
+        parts = self._fps[cols]
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    # =========================
+    # Add a batch; only the new rows are hashed
+    # Returns a mask over the batch: True = first time this row/key was ever seen
+    # (the keep='first' survivors of the batch, across all earlier batches too)
+    # =========================
+
+    def append(self, batch, subset=None):
+        wanted = self._subset(subset, batch.columns)
+        self._ensure(wanted)
+        self._batches.append(batch)
+        self._frame = None
+        new_rows = None
+        for cols, parts in self._fps.items():
+            fps = self._hash(batch, cols)
+            first_in_batch = ~pd.Series(fps).duplicated().to_numpy()
+            is_new = first_in_batch & ~self._seen[cols].contains(fps)
+            self._seen[cols].add(fps[is_new])
+            parts.append(fps)
+            if cols == wanted:
+                new_rows = is_new
+        return new_rows
+
+    # =========================
+    # Same answers as the pandas methods in code.py
+    # =========================
+
+    def duplicated(self, subset=None, keep='first'):
+        fps = pd.Series(self.fingerprints(subset), index=self.frame.index)
+        return fps.duplicated(keep=keep)
+
+    def drop_duplicates(self, subset=None, keep='first'):
+        return self.frame[~self.duplicated(subset, keep=keep).to_numpy()]
+
+    def unique(self, column):
+        values = self.frame[column].to_numpy()
+        return values[~self.duplicated(column).to_numpy()]
+
+    def nunique(self, column, dropna=True):
+        cols = self._subset(column)
+        self._ensure(cols)
+        count = len(self._seen[cols])
+        if dropna and self.frame[column].isna().any():
+            count -= 1
+        return count
+
+
+if __name__ == '__main__':
+    # =========================
+    # Same df1 as code.py
+    # =========================
+    df1 = pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie', 'Alice', 'Eve', 'Frank', 'Bob'],
+        'Score': [85, 67, 90, 85, 67, 77, 67],
+        'Grade': ['B', 'C', 'A', 'B', 'C', 'B', 'C']
+    })
+    index = DuplicateIndex(df1)
+
+    print("# Full duplicate rows:")
+    print(df1[index.duplicated()])
+    print("\n# Duplicate Name rows (not first occurrence):")
+    print(df1[index.duplicated(subset='Name')])
+    print("\n# DataFrame with duplicate Names removed (keep first):")
+    print(index.drop_duplicates(subset='Name', keep='first'))
+    print("\n# Unique scores:", index.unique('Score'), "count:", index.nunique('Score'))
+
+    # Output:
+    # # Full duplicate rows:
+    #     Name  Score Grade
+    # 3  Alice     85     B
+    # 6    Bob     67     C
+    #
+    # # Unique scores: [85 67 90 77] count: 4
+
+    # =========================
+    # A new batch arrives: only its rows are hashed
+    # =========================
+    batch = pd.DataFrame({'Name': ['Grace', 'Eve'], 'Score': [88, 67], 'Grade': ['B', 'C']}, index=[7, 8])
+    print("\n# New rows in the batch:", index.append(batch))
+    # Output:
+    # # New rows in the batch: [ True False]
@@ -0,0 +1,216 @@
+# =========================
+# Streaming cross-file deduplication (keep='first', like code.py's drop_duplicates)
+# =========================
+#
+# The set of seen keys may not fit in RAM, so two modes are offered:
+#
+# dedup_exact  — spills (key, row number) runs to disk, hash-partitioned by key, then
+#                dedups each partition exactly with drop_duplicates(keep='first') and
+#                writes the surviving row numbers back to disk as sorted .npy runs.
+#                A second pass over the input keeps exactly those rows. CSV paths and
+#                DataFrames are read again; an iterable of frames can only be read once,
+#                so its chunks are spilled in pass 1 and pass 2 reads the spill files.
+#                Memory ≈ one partition of keys.
+#
+# dedup_bloom  — one pass with a Bloom filter sized for `capacity` keys at a chosen
+#                false-positive rate. A false positive drops a row whose key was new,
+#                so about fp_rate of the distinct keys may be lost; duplicates are
+#                never kept. Memory = the bit array only.
+#
+# Keys are hashed with code09spill._key_hash, so 5 and 5.0 count as the same key (as in
+# drop_duplicates) even when they come from files that were parsed as int and as float.
+# Both report memory use and throughput (seconds per million rows).
+
+import math
+import os
+import resource
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from code09spill import SPILL_FORMAT, _chunks, _key_hash, _read_spill, _write_spill
+
+
+def _key_columns(chunk, subset):
+    if subset is None:
+        return list(chunk.columns)
+    return [subset] if isinstance(subset, str) else list(subset)
+
+
+def _peak_rss_mb():
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _stats(rows_in, rows_out, seconds, state_bytes):
+    return {
+        'rows_in': rows_in,
+        'rows_out': rows_out,
+        'seconds': seconds,
+        'seconds_per_million_rows': seconds / rows_in * 1e6 if rows_in else 0.0,
+        'rows_per_second': rows_in / seconds if seconds else 0.0,
+        'state_mb': state_bytes / 2 ** 20,
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+# =========================
+# Exact mode: partitioned key runs on disk
+# =========================
+
+# 🟢 Pass-1 chunks of every source; chunks of one-shot sources are also spilled to `spills`
+def _first_pass(sources, chunksize, folder, spills):
+    for s, source in enumerate(sources):
+        one_shot = not isinstance(source, (str, pd.DataFrame))
+        for j, chunk in enumerate(_chunks(source, chunksize)):
+            if one_shot:
+                path = os.path.join(folder, f'source-{s}-{j}.{SPILL_FORMAT}')
+                _write_spill(chunk, path)
+                spills.setdefault(s, []).append(path)
+            yield chunk
+
+
+def _second_pass(sources, chunksize, spills):
+    for s, source in enumerate(sources):
+        if isinstance(source, (str, pd.DataFrame)):
+            yield from _chunks(source, chunksize)
+        else:
+            yield from map(_read_spill, spills.get(s, []))
+
+
+def dedup_exact(sources, out_path, subset=None, chunksize=1_000_000, n_partitions=64, tmp_dir=None):
+    start = time.perf_counter()
+    folder = tempfile.mkdtemp(prefix='dedup-', dir=tmp_dir)
+    rows_in = rows_out = 0
+    largest_partition = 0
+    sources, spills = list(sources), {}
+    try:
+        # Pass 1: spill (key columns, row number) per partition
+        runs = [[] for _ in range(n_partitions)]
+        for i, chunk in enumerate(_first_pass(sources, chunksize, folder, spills)):
+            keys = chunk[_key_columns(chunk, subset)].reset_index(drop=True)
+            keys['_row'] = np.arange(rows_in, rows_in + len(chunk))
+            rows_in += len(chunk)
+            part = _key_hash(keys.drop(columns='_row')) % np.uint64(n_partitions)
+            for p in np.unique(part):
+                path = os.path.join(folder, f'run-{p}-{i}.{SPILL_FORMAT}')
+                _write_spill(keys[part == p], path)
+                runs[p].append(path)
+
+        # Merge each partition's runs; runs are in row order, so keep='first' = smallest row number
+        keep_files = []
+        for p, paths in enumerate(runs):
+            if not paths:
+                continue
+            keys = pd.concat([_read_spill(path) for path in paths], ignore_index=True)
+            largest_partition = max(largest_partition, int(keys.memory_usage(deep=True).sum()))
+            kept = keys.drop_duplicates(subset=[c for c in keys.columns if c != '_row'], keep='first')
+            keep_file = os.path.join(folder, f'keep-{p}.npy')
+            np.save(keep_file, np.sort(kept['_row'].to_numpy()))
+            keep_files.append(keep_file)
+            for path in paths:
+                os.remove(path)
+
+        # Pass 2: stream the input again and keep the surviving row numbers
+        keep = [np.load(path, mmap_mode='r') for path in keep_files]
+        row = 0
+        with open(out_path, 'w', newline='') as out:
+            header = True
+            for chunk in _second_pass(sources, chunksize, spills):
+                lo, hi = row, row + len(chunk)
+                mask = np.zeros(len(chunk), dtype=bool)
+                for rows in keep:
+                    a, b = np.searchsorted(rows, [lo, hi])
+                    mask[np.asarray(rows[a:b]) - lo] = True
+                chunk[mask].to_csv(out, index=False, header=header)
+                header = False
+                rows_out += int(mask.sum())
+                row = hi
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+    return _stats(rows_in, rows_out, time.perf_counter() - start, largest_partition)
+
+
+# =========================
+# Approximate mode: Bloom filter
+# =========================
+
+class BloomFilter:
+
+    def __init__(self, capacity, fp_rate=0.01):
+        # Standard sizing: m = -n ln p / (ln 2)², k = (m / n) ln 2
+        self.n_bits = max(8, int(math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)))
+        self.n_hashes = max(1, int(round(self.n_bits / capacity * math.log(2))))
+        self.bits = np.zeros((self.n_bits + 7) // 8, dtype=np.uint8)
+
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+
+    # k bit positions per key from two 64-bit hashes (double hashing: h1 + i·h2)
+    def _positions(self, h1, h2):
+        i = np.arange(self.n_hashes, dtype=np.uint64)
+        with np.errstate(over='ignore'):
+            return ((h1[:, None] + i[None, :] * h2[:, None]) % np.uint64(self.n_bits)).astype(np.int64)
+
+    def contains(self, h1, h2):
+        pos = self._positions(h1, h2)
+        return ((self.bits[pos >> 3] >> (pos & 7).astype(np.uint8)) & 1).all(axis=1).astype(bool)
+
+    def add(self, h1, h2):
+        pos = self._positions(h1, h2).ravel()
+        np.bitwise_or.at(self.bits, pos >> 3, (1 << (pos & 7)).astype(np.uint8))
+
+
+def dedup_bloom(sources, out_path, subset=None, capacity=10_000_000, fp_rate=0.01, chunksize=1_000_000):
+    start = time.perf_counter()
+    bloom = BloomFilter(capacity, fp_rate)
+    rows_in = rows_out = 0
+    with open(out_path, 'w', newline='') as out:
+        header = True
+        for chunk in (c for source in sources for c in _chunks(source, chunksize)):
+            keys = chunk[_key_columns(chunk, subset)]
+            h1 = _key_hash(keys)
+            h2 = _key_hash(keys, hash_key='0123456789abcdef') | np.uint64(1)
+            # keep='first' inside the chunk, then drop keys the filter has (probably) seen
+            keep = ~pd.Series(h1).duplicated().to_numpy()
+            keep[keep] = ~bloom.contains(h1[keep], h2[keep])
+            bloom.add(h1[keep], h2[keep])
+            chunk[keep].to_csv(out, index=False, header=header)
+            header = False
+            rows_in += len(chunk)
+            rows_out += int(keep.sum())
+    stats = _stats(rows_in, rows_out, time.perf_counter() - start, bloom.nbytes)
+    stats.update({'bloom_bits': bloom.n_bits, 'bloom_hashes': bloom.n_hashes, 'fp_rate': fp_rate})
+    return stats
+
+
+if __name__ == '__main__':
+    # =========================
+    # Three files with overlapping Names (like code.py's df1, but spread across files)
+    # =========================
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(3):
+        frame = pd.DataFrame({
+            'Name': [f'user{k}' for k in rng.integers(0, 300_000, 400_000)],
+            'Score': rng.integers(50, 100, 400_000),
+        })
+        paths.append(f'scores_{i}.csv')
+        frame.to_csv(paths[-1], index=False)
+
+    exact = dedup_exact(paths, 'dedup_exact.csv', subset='Name', chunksize=200_000, n_partitions=16)
+    bloom = dedup_bloom(paths, 'dedup_bloom.csv', subset='Name', capacity=300_000, fp_rate=0.01,
+                        chunksize=200_000)
+    print("# Exact:", exact)
+    print("# Bloom:", bloom)
+
+    # Check the exact mode against drop_duplicates(subset='Name', keep='first') in memory
+    everything = pd.concat([pd.read_csv(p) for p in paths], ignore_index=True)
+    expected = everything.drop_duplicates(subset='Name', keep='first').reset_index(drop=True)
+    pd.testing.assert_frame_equal(pd.read_csv('dedup_exact.csv'), expected)
+    print("# Exact result matches drop_duplicates(keep='first')")
+    print("# Bloom kept", bloom['rows_out'], "of", len(expected), "distinct names")
@@ -0,0 +1,52 @@
+# 🟢 Shared key index for JoinIndex (code09join.py) and LookupIndex (codelookup.py)
+#
+# Both classes need the same per-column work, done once:
+#   - the values are factorized into codes and the rows grouped by code (one argsort)
+#   - distinct values go into a hash table (pd.Index engine) or a sorted array
+# presorted=True skips the factorize/argsort for values that are already ascending:
+# groups are then the contiguous runs.
+# Missing values form one group and match each other, like pd.merge and isin do.
+# method='sorted' needs mutually comparable values (numbers, or strings with no missing values).
+
+import numpy as np
+import pandas as pd
+
+
+class KeyIndex:
+
+    def __init__(self, values, method='hash', presorted=False):
+        if method not in ('hash', 'sorted'):
+            raise ValueError("method must be 'hash' or 'sorted'")
+        self.method = method
+        values = np.asarray(values)
+
+        if presorted:
+            if not pd.Index(values).is_monotonic_increasing:
+                raise ValueError('presorted=True but the values are not sorted')
+            new_run = np.ones(len(values), dtype=bool)
+            new_run[1:] = values[1:] != values[:-1]
+            self.codes = np.cumsum(new_run) - 1
+            self.uniques = values[new_run]
+            self.order = np.arange(len(values))
+            self.starts = np.append(np.flatnonzero(new_run), len(values))
+        else:
+            codes, uniques = pd.factorize(values, sort=(method == 'sorted'), use_na_sentinel=False)
+            self.codes = codes
+            self.uniques = np.asarray(uniques)
+            self.order = np.argsort(codes, kind='stable')
+            self.starts = np.searchsorted(codes[self.order], np.arange(len(uniques) + 1))
+
+        if method == 'hash':
+            self._table = pd.Index(self.uniques)
+            self._table.get_indexer(self.uniques[:1])     # build the hash table now, not on first probe
+
+    # 🟢 Group of each key (-1 = not present)
+    def lookup(self, keys):
+        keys = np.asarray(keys)
+        if self.method == 'hash':
+            return self._table.get_indexer(keys)
+        pos = np.searchsorted(self.uniques, keys)
+        found = pos < len(self.uniques)
+        candidates = self.uniques[pos[found]]
+        found[found] = (candidates == keys[found]) | (pd.isna(candidates) & pd.isna(keys[found]))
+        return np.where(found, pos, -1)
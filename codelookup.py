@@ -0,0 +1,145 @@
+# =========================
+# 🟢 Persistent lookup index for isin() (code.py) and .loc label access (code5.py)
+# =========================
+#
+# df1['Score'].isin([67, 85]) hashes every row of the column on each call, and a loop of
+# df1.loc['Charlie', 'Score'] resolves one label at a time through pandas' indexing layer.
+# LookupIndex does the per-column work once, through the shared KeyIndex (codekeys.py):
+#   - the values are factorized into codes, and the rows are grouped by code (one argsort)
+#   - distinct values go into a hash table (pd.Index engine) or a sorted array
+# After that, a batch of keys costs O(1) (hash) or O(log n) (sorted) per key:
+#   contains(keys)   → is each key present?                (batched membership)
+#   isin(values)     → same mask as series.isin(values)    (a take over the codes)
+#   positions(labels)→ first row of each label              (batched label → row)
+#   get(labels, col) → same values as [df.loc[l, col] for l in labels] on a unique index
+# method='sorted' needs mutually comparable values (numbers, or strings with no missing values).
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from codekeys import KeyIndex
+
+
+class LookupIndex(KeyIndex):
+
+    # values: a Series, an Index (e.g. df1.index after set_index('Name')) or an array
+    def __init__(self, values, frame=None, method='hash'):
+        super().__init__(values, method=method)
+        self.frame = frame
+        self.is_unique = len(self.uniques) == len(self.codes)
+
+    @classmethod
+    def from_frame(cls, df, column=None, method='hash'):
+        values = df.index if column is None else df[column]
+        return cls(values, frame=df, method=method)
+
+    def contains(self, keys):
+        return self.lookup(keys) >= 0
+
+    # 🟢 Row mask, same as series.isin(values)
+    def isin(self, values):
+        hit = np.zeros(len(self.uniques), dtype=bool)
+        found = self.lookup(pd.unique(np.asarray(values)))
+        hit[found[found >= 0]] = True
+        return hit[self.codes]
+
+    # 🟢 First row position of each label; missing labels raise KeyError like .loc,
+    # or get -1 with missing='ignore'
+    def positions(self, labels, missing='raise'):
+        groups = self.lookup(labels)
+        if missing == 'raise' and (groups < 0).any():
+            raise KeyError(list(np.asarray(labels)[groups < 0][:5]))
+        rows = self.order[self.starts[np.maximum(groups, 0)]] if len(self.order) else np.zeros(len(groups), int)
+        return np.where(groups >= 0, rows, -1)
+
+    # 🟢 Every row of each label: (label number, row) pairs, rows in frame order
+    def all_positions(self, labels):
+        groups = self.lookup(labels)
+        g = np.maximum(groups, 0)
+        lo = np.where(groups >= 0, self.starts[g], 0)
+        counts = np.where(groups >= 0, self.starts[g + 1] - lo, 0) if len(self.starts) > 1 else np.zeros(len(g), int)
+        label_no = np.repeat(np.arange(len(groups)), counts)
+        offsets = np.arange(len(label_no)) - np.repeat(np.cumsum(counts) - counts, counts)
+        return label_no, self.order[np.repeat(lo, counts) + offsets]
+
+    # 🟢 Batched df.loc[label, column]
+    def get(self, labels, column):
+        if not self.is_unique:
+            raise ValueError('get() needs unique labels; use all_positions() for duplicates')
+        return self.frame[column].to_numpy()[self.positions(labels)]
+
+
+# =========================
+# 🟢 Benchmark: isin() and a scalar .loc loop vs one LookupIndex
+# =========================
+
+def benchmark(n_rows=1_000_000, set_size=1_000, calls=20, n_lookups=20_000, method='hash', seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'Name': [f'student{i}' for i in rng.permutation(n_rows)],
+                       'Score': rng.integers(0, 1_000_000, n_rows)}).set_index('Name')
+    wanted = [rng.integers(0, 1_000_000, set_size) for _ in range(calls)]
+    labels = df.index.to_numpy()[rng.integers(0, n_rows, n_lookups)]
+
+    start = time.perf_counter()
+    by_score = LookupIndex.from_frame(df, 'Score', method=method)
+    by_name = LookupIndex.from_frame(df, method=method)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [df['Score'].isin(w).to_numpy() for w in wanted]
+    isin_s = time.perf_counter() - start
+    start = time.perf_counter()
+    masks = [by_score.isin(w) for w in wanted]
+    index_isin_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    looped = [df.loc[label, 'Score'] for label in labels]
+    loc_s = time.perf_counter() - start
+    start = time.perf_counter()
+    batched = by_name.get(labels, 'Score')
+    index_get_s = time.perf_counter() - start
+
+    assert all((a == b).all() for a, b in zip(expected, masks))
+    assert (np.asarray(looped) == batched).all()
+    return {'build_s': build_s,
+            f'isin_x{calls}_s': isin_s, f'index_isin_x{calls}_s': index_isin_s,
+            f'loc_loop_{n_lookups}_s': loc_s, f'index_get_{n_lookups}_s': index_get_s,
+            'loc_speedup': loc_s / index_get_s}
+
+
+if __name__ == '__main__':
+    # 🟢 Same df1 as code5.py, indexed by Name
+    df1 = pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve'],
+        'Score': [85, 67, 90, 76, 92],
+        'Grade': ['B', 'C', 'A', 'B', 'A']
+    }).set_index('Name')
+
+    names = LookupIndex.from_frame(df1)
+    scores = LookupIndex.from_frame(df1, 'Score', method='sorted')
+
+    print("# Score of Charlie and Eve:", names.get(['Charlie', 'Eve'], 'Score'))
+    print("# Rows of Bob and Eve:")
+    print(df1.iloc[names.positions(['Bob', 'Eve'])])
+    print("# Rows where Score is 67 or 85:")
+    print(df1[scores.isin([67, 85])])
+    print("# Known names:", names.contains(['Alice', 'Zoe']))
+
+    # Output:
+    # # Score of Charlie and Eve: [90 92]
+    # # Rows of Bob and Eve:
+    #       Score Grade
+    # Name
+    # Bob      67     C
+    # Eve      92     A
+    # # Rows where Score is 67 or 85:
+    #        Score Grade
+    # Name
+    # Alice     85     B
+    # Bob       67     C
+    # # Known names: [ True False]
+
+    for method in ('hash', 'sorted'):
+        print(method, benchmark(method=method))
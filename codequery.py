@@ -0,0 +1,278 @@
+# 🟢 Compiled, cached query expressions for code11.py's df.query("sales > 100 and region == 'East'")
+# and code5.py's df1.query("Score > 80")
+#
+# df.query() parses and plans the expression string on every call. compile_query() parses
+# it once with Python's ast module into a small predicate tree and keeps the result in an
+# LRU cache keyed by the expression text, so a service that runs the same strings
+# thousands of times only pays for evaluation.
+#
+# Evaluation is fused across a compound predicate instead of building one full-length
+# boolean array per term and combining them (what numexpr would do in blocks):
+#   - 'and' terms run cheapest first (numeric comparisons before string ones), and once
+#     few rows are still selected, later terms are evaluated on those rows only
+#   - 'or' terms likewise only look at the rows that are not selected yet
+# Anything outside plain comparisons (arithmetic like `sales * 2 > 100`, functions, ...)
+# becomes one leaf that is handed to df.eval, so every query df.query accepts still works.
+# Local variables work like in df.query: compile_query("Score > @cut")(df1, cut=80).
+# `&` / `|` bind looser than comparisons in df.query but tighter in Python, so an expression
+# that uses them goes to df.eval whole instead of through Python's parse tree.
+
+import ast
+import functools
+import operator
+import re
+import time
+
+import numpy as np
+import pandas as pd
+
+QUERY_CACHE_SIZE = 256
+SUBSET_RATIO = 0.25      # below this share of undecided rows, later terms only see those rows
+_AT = '__at_'
+_STRING = r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\""   # quoted literal, left as it is
+
+_COMPARE = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne, ast.Lt: operator.lt,
+    ast.LtE: operator.le, ast.Gt: operator.gt, ast.GtE: operator.ge,
+}
+_FLIPPED = {ast.Lt: ast.Gt, ast.LtE: ast.GtE, ast.Gt: ast.Lt, ast.GtE: ast.LtE, ast.Eq: ast.Eq, ast.NotEq: ast.NotEq}
+
+
+def _to_bool(result, na_value=False):
+    if isinstance(result, np.ndarray):
+        return result.astype(bool, copy=False)
+    return result.to_numpy(dtype=bool, na_value=na_value)
+
+
+def _column_values(series, rows):
+    values = series.to_numpy() if isinstance(series.dtype, np.dtype) else series.array
+    return values if rows is None else values[rows]
+
+
+# =========================
+# Predicate tree
+# Every node returns a bool ndarray for the given rows (rows=None → all rows)
+# =========================
+
+class _Compare:
+
+    def __init__(self, column, op, value, text):
+        self.column, self.op, self.value, self.text = column, op, value, text
+
+    def cost(self, df):
+        if self.column not in df:
+            return 4
+        return 1 if df[self.column].dtype.kind in 'biufcmM' else 3
+
+    def _resolve(self, env):
+        if isinstance(self.value, str) and self.value.startswith(_AT):
+            return env[self.value[len(_AT):]]
+        if isinstance(self.value, tuple):
+            return [env[v[len(_AT):]] if isinstance(v, str) and v.startswith(_AT) else v for v in self.value]
+        return self.value
+
+    def mask(self, df, rows, env):
+        if self.column not in df:
+            return _Fallback(self.text).mask(df, rows, env)
+        values = _column_values(df[self.column], rows)
+        value = self._resolve(env)
+        if isinstance(values, np.ndarray) and values.dtype.kind in 'mM' and isinstance(value, str):
+            # df.query parses the string for <, <=, >, >= only; == / != / in see an unequal string
+            if self.op in (operator.eq, operator.ne):
+                return np.full(len(values), self.op is operator.ne)
+            if self.op not in ('in', 'not in'):
+                value = pd.Timestamp(value) if values.dtype.kind == 'M' else pd.Timedelta(value)
+        if self.op in ('in', 'not in'):
+            hit = pd.Series(values, copy=False).isin(np.atleast_1d(value)).to_numpy()
+            return ~hit if self.op == 'not in' else hit
+        return _to_bool(self.op(values, value), na_value=self.op is operator.ne)
+
+
+class _Fallback:
+
+    def __init__(self, text):
+        self.text = text
+
+    def cost(self, df):
+        return 4
+
+    def mask(self, df, rows, env):
+        frame = df if rows is None else df.iloc[rows]
+        return _to_bool(np.asarray(frame.eval(self.text, local_dict=env)))
+
+
+class _Not:
+
+    def __init__(self, child):
+        self.child = child
+
+    def cost(self, df):
+        return self.child.cost(df)
+
+    def mask(self, df, rows, env):
+        return ~self.child.mask(df, rows, env)
+
+
+class _BoolOp:
+
+    def __init__(self, kind, children):
+        self.kind, self.children = kind, children
+
+    def cost(self, df):
+        return 5
+
+    def mask(self, df, rows, env):
+        n = len(df) if rows is None else len(rows)
+        want = self.kind == 'and'
+        live = None                      # positions (into rows) still undecided
+        for child in sorted(self.children, key=lambda c: c.cost(df)):
+            if live is None:
+                hit = child.mask(df, rows, env)
+                live = np.flatnonzero(hit if want else ~hit)
+            elif len(live) < SUBSET_RATIO * n:
+                hit = child.mask(df, live if rows is None else rows[live], env)
+                live = live[hit if want else ~hit]
+            else:
+                # Most rows still undecided: a full pass is cheaper than gathering them first
+                hit = child.mask(df, rows, env)[live]
+                live = live[hit if want else ~hit]
+            if not len(live):
+                break
+        # and: the undecided rows passed every term; or: they failed every term
+        out = np.full(n, not want)
+        out[live] = want
+        return out
+
+
+# =========================
+# Compile: expression text → predicate tree
+# =========================
+
+# 🟢 Rename @variables ↔ _AT names, leaving string literals ('a@b.com') untouched
+def _rename(text, pattern, repl):
+    return re.sub(f'({_STRING})|{pattern}', lambda m: m.group(1) or repl + m.group(2), text)
+
+
+def _literal(node):
+    if isinstance(node, ast.Name) and node.id.startswith(_AT):
+        return node.id
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return tuple(_literal(e) for e in node.elts)
+    return ast.literal_eval(node)
+
+
+def _build(node, text_of):
+    if isinstance(node, ast.BoolOp):
+        return _BoolOp('and' if isinstance(node.op, ast.And) else 'or', [_build(v, text_of) for v in node.values])
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return _Not(_build(node.operand, text_of))
+    if isinstance(node, ast.Compare) and len(node.ops) > 1:
+        # a < b < c → (a < b) and (b < c)
+        terms = zip([node.left] + node.comparators[:-1], node.ops, node.comparators)
+        return _BoolOp('and', [_build(ast.Compare(l, [op], [r]), text_of) for l, op, r in terms])
+    if isinstance(node, ast.Compare):
+        left, op, right = node.left, type(node.ops[0]), node.comparators[0]
+        if isinstance(left, ast.Name) and not left.id.startswith(_AT):
+            column, other = left.id, right
+        elif isinstance(right, ast.Name) and not right.id.startswith(_AT) and op in _FLIPPED:
+            column, other, op = right.id, left, _FLIPPED[op]
+        else:
+            return _Fallback(text_of(node))
+        try:
+            value = _literal(other)
+        except ValueError:
+            return _Fallback(text_of(node))
+        if op in (ast.In, ast.NotIn):
+            return _Compare(column, 'in' if op is ast.In else 'not in', value, text_of(node))
+        if op in _COMPARE:
+            return _Compare(column, _COMPARE[op], value, text_of(node))
+    return _Fallback(text_of(node))
+
+
+class CompiledQuery:
+
+    def __init__(self, expr):
+        self.expr = expr
+        source = _rename(expr, r'@(\w+)', _AT)
+        try:
+            tree = ast.parse(source.strip(), mode='eval')
+        except SyntaxError:         # pandas-only syntax such as `backticked names`
+            self.root = _Fallback(expr)
+            return
+        if any(isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr))
+               for node in ast.walk(tree)):
+            self.root = _Fallback(expr)     # pandas precedence for & / |
+            return
+        # Text handed to df.eval for fallback leaves, with @variables restored
+        text_of = lambda node: _rename(ast.unparse(node), _AT + r'(\w+)', '@')
+        self.root = _build(tree.body, text_of)
+
+    # 🟢 Boolean row mask, same as df.eval(expr) for a filter expression
+    def __call__(self, df, **env):
+        return self.root.mask(df, None, env)
+
+    # 🟢 Same rows as df.query(expr)
+    def filter(self, df, **env):
+        return df[self(df, **env)]
+
+
+@functools.lru_cache(maxsize=QUERY_CACHE_SIZE)
+def compile_query(expr):
+    return CompiledQuery(expr)
+
+
+def query(df, expr, **env):
+    return compile_query(expr).filter(df, **env)
+
+
+# =========================
+# 🟢 Benchmark: df.query vs cached compiled query
+# Many calls on small fresh frames (parsing dominates) and a few on a large frame
+# =========================
+
+def benchmark(expr="sales > 100 and region == 'East'", small_calls=2_000, n_rows=5_000_000, large_calls=5, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def frame(n):
+        return pd.DataFrame({'sales': rng.integers(50, 250, n),
+                             'region': pd.Series(rng.choice(['East', 'West', 'North', 'South'], n), dtype='str'),
+                             'name': rng.integers(0, 1000, n)})
+
+    results = {}
+    for label, n, calls in [('small', 8, small_calls), ('large', n_rows, large_calls)]:
+        frames = [frame(n) for _ in range(min(calls, 20))]
+        start = time.perf_counter()
+        for i in range(calls):
+            expected = frames[i % len(frames)].query(expr)
+        query_s = time.perf_counter() - start
+        start = time.perf_counter()
+        for i in range(calls):
+            result = query(frames[i % len(frames)], expr)
+        compiled_s = time.perf_counter() - start
+        pd.testing.assert_frame_equal(result, expected)
+        results[label] = {'rows': n, 'calls': calls, 'df_query_s': query_s, 'compiled_s': compiled_s,
+                          'speedup': query_s / compiled_s}
+    results['cache'] = compile_query.cache_info()._asdict()
+    return results
+
+
+if __name__ == '__main__':
+    # 🟢 Same data as code11.py
+    df = pd.DataFrame({
+        'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eva', 'Frank', 'Grace', None],
+        'sales': [100, 200, 150, 180, 120, 130, 220, 110],
+        'region': ['East', 'West', 'East', 'West', 'East', 'West', 'East', 'East'],
+    })
+    print(query(df, "sales > 100 and region == 'East'"))
+    # Output:
+    #       name  sales region
+    # 2  Charlie    150   East
+    # 4      Eva    120   East
+    # 6    Grace    220   East
+    # 7      NaN    110   East
+
+    # 🟢 code5.py's filter, with a local variable
+    df1 = pd.DataFrame({'Name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve'],
+                        'Score': [85, 75, 90, 76, 92]}).set_index('Name')
+    print(query(df1, "Score > @cut", cut=80))
+    print(benchmark())
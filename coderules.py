@@ -0,0 +1,231 @@
+# =========================
+# Compiled rule engine for np.select-style conditional columns (code.py 'Performance')
+# =========================
+#
+# code.py builds 'Performance' with np.select over three boolean masks. Every condition
+# allocates a full-length mask, and overlapping ranges are evaluated independently.
+#
+# RuleSet compiles declarative rules instead:
+#   - every comparison on a numeric column only splits the number line at its constant,
+#     so each column is cut into segments: (-inf, e0), {e0}, (e0, e1), {e1}, ... , NaN
+#   - the rules are evaluated ONCE per segment (on a tiny grid), which gives a lookup
+#     table with the np.select answer for every combination of segments
+#   - at run time each column costs one np.searchsorted, and the label is a table lookup
+# First matching rule wins and unmatched rows get the default, exactly like np.select.
+# Rules on non-numeric columns (or too many segment combinations) fall back to a fused
+# pass that only evaluates each rule on the rows that are still unassigned.
+
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+OPS = {
+    '<': np.less,
+    '<=': np.less_equal,
+    '>': np.greater,
+    '>=': np.greater_equal,
+    '==': np.equal,
+    '!=': np.not_equal,
+    'in': lambda x, values: np.isin(x, values),
+}
+
+MAX_TABLE_SIZE = 1_000_000
+
+
+class RuleSet:
+
+    # rules: list of (label, [(column, op, value), ...]) — conditions in a rule are ANDed
+    def __init__(self, rules, default='Unknown'):
+        for _, conditions in rules:
+            for _, op, _ in conditions:
+                if op not in OPS:
+                    raise ValueError(f'Unsupported operator {op!r}; use one of {sorted(OPS)}')
+        self.rules = [(label, list(conditions)) for label, conditions in rules]
+        self.default = default
+        self.labels = np.asarray([label for label, _ in self.rules] + [default])
+        self.columns = sorted({col for _, conditions in self.rules for col, _, _ in conditions})
+        self._compiled = None
+
+    # =========================
+    # Compile: segment edges per column + lookup table over the segment grid
+    # =========================
+
+    def _edges(self, col):
+        points = []
+        for _, conditions in self.rules:
+            for c, op, value in conditions:
+                if c == col:
+                    points.extend(np.atleast_1d(value) if op == 'in' else [value])
+        return np.unique(np.asarray(points, dtype='float64'))
+
+    @staticmethod
+    def _representatives(edges):
+        # One value inside each segment: below, on each edge, between edges, above, NaN
+        reps = [edges[0] - 1] if len(edges) else [0.0]
+        for i, edge in enumerate(edges):
+            reps.append(edge)
+            reps.append((edge + edges[i + 1]) / 2 if i + 1 < len(edges) else edge + 1)
+        reps.append(np.nan)
+        return np.asarray(reps)
+
+    def compile(self, df):
+        numeric = all(pd.api.types.is_numeric_dtype(df[col]) for col in self.columns)
+        if not numeric:
+            self._compiled = 'fused'
+            return self
+        edges = {col: self._edges(col) for col in self.columns}
+        reps = {col: self._representatives(edges[col]) for col in self.columns}
+        sizes = [len(reps[col]) for col in self.columns]
+        if np.prod(sizes, dtype='float64') > MAX_TABLE_SIZE:
+            self._compiled = 'fused'
+            return self
+
+        # Evaluate each rule on the grid of representatives (broadcast, one axis per column)
+        grid = {}
+        for axis, col in enumerate(self.columns):
+            shape = [1] * len(self.columns)
+            shape[axis] = sizes[axis]
+            grid[col] = reps[col].reshape(shape)
+        with np.errstate(invalid='ignore'):
+            masks = [np.broadcast_to(self._evaluate(conditions, grid), sizes) for _, conditions in self.rules]
+        table = np.select(masks, np.arange(len(self.rules)), default=len(self.rules))
+        self._compiled = (edges, sizes, table.ravel().astype(np.min_scalar_type(len(self.rules))))
+        return self
+
+    @staticmethod
+    def _evaluate(conditions, data, rows=None):
+        mask = True
+        for col, op, value in conditions:
+            x = data[col] if rows is None else data[col][rows]
+            mask = mask & OPS[op](x, value)
+        return mask
+
+    # =========================
+    # Apply
+    # =========================
+
+    @staticmethod
+    def _segments(x, edges):
+        # Segment id: 2*i for the open interval below edges[i], 2*i+1 for x == edges[i],
+        # 2*len(edges) above the last edge, 2*len(edges)+1 for NaN
+        n = len(edges)
+        idx = np.searchsorted(edges, x, side='left')
+        seg = 2 * idx
+        if n:
+            on_edge = edges[np.minimum(idx, n - 1)] == x
+            seg += on_edge & (idx < n)
+        seg[np.isnan(x)] = 2 * n + 1
+        return seg
+
+    def codes(self, df):
+        if self._compiled is None:
+            self.compile(df)
+        if self._compiled == 'fused':
+            return self._codes_fused(df)
+        edges, sizes, table = self._compiled
+        flat = np.zeros(len(df), dtype=np.int32 if len(table) < 2 ** 31 else np.int64)
+        for col, size in zip(self.columns, sizes):
+            flat *= size
+            flat += self._segments(df[col].to_numpy(dtype='float64'), edges[col])
+        return table[flat]
+
+    def _codes_fused(self, df):
+        data = {col: df[col].to_numpy() for col in self.columns}
+        out = np.full(len(df), len(self.rules), dtype=np.min_scalar_type(len(self.rules)))
+        todo = np.arange(len(df))
+        for code, (_, conditions) in enumerate(self.rules):
+            if not len(todo):
+                break
+            hit = np.asarray(self._evaluate(conditions, data, todo), dtype=bool)
+            hit = np.broadcast_to(hit, todo.shape)
+            out[todo[hit]] = code
+            todo = todo[~hit]
+        return out
+
+    # Same result as np.select(conditions, choices, default=default)
+    def apply(self, df):
+        return self.labels[self.codes(df)]
+
+
+# =========================
+# Shortcut for pure range tiers on one column (code.py's Score → Performance)
+# bins are the lower edges; value >= bins[i] (and < bins[i+1]) gets labels[i],
+# values under bins[0] get `below` (or the default when below is None)
+# =========================
+
+def bucketize(series, bins, labels, below=None, default='Unknown'):
+    rules = []
+    for i, (lo, label) in enumerate(zip(bins, labels)):
+        conditions = [(series.name, '>=', lo)]
+        if i + 1 < len(bins):
+            conditions.append((series.name, '<', bins[i + 1]))
+        rules.append((label, conditions))
+    if below is not None:
+        rules.append((below, [(series.name, '<', bins[0])]))
+    return RuleSet(rules, default=default).apply(series.to_frame())
+
+
+# =========================
+# Benchmark: np.select vs RuleSet (time and peak memory)
+# =========================
+
+def benchmark(n_rows=5_000_000, n_tiers=30, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'Score': rng.integers(0, 100, n_rows).astype('float64'),
+                       'Age': rng.integers(18, 70, n_rows)})
+    bounds = np.linspace(0, 100, n_tiers + 1)
+    rules = [(f'T{i}', [('Score', '>=', bounds[i]), ('Score', '<', bounds[i + 1]), ('Age', '<', 40)])
+             for i in range(n_tiers)]
+    ruleset = RuleSet(rules)
+
+    def run_select():
+        conditions = [(df['Score'] >= bounds[i]) & (df['Score'] < bounds[i + 1]) & (df['Age'] < 40)
+                      for i in range(n_tiers)]
+        return np.select(conditions, [label for label, _ in rules], default='Unknown')
+
+    results = {}
+    for name, fn in [('np.select', run_select), ('RuleSet', lambda: ruleset.apply(df))]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        out = fn()
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results[name] = {'seconds': seconds, 'peak_mb': peak / 2 ** 20}
+        results.setdefault('outputs', []).append(out)
+    results['identical'] = bool((results['outputs'][0] == results['outputs'][1]).all())
+    del results['outputs']
+    return results
+
+
+if __name__ == '__main__':
+    # =========================
+    # Same df1 as code.py
+    # =========================
+    df1 = pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie', 'Alice', 'Eve', 'Frank', 'Bob'],
+        'Score': [85, 67, 90, 85, 67, 77, 67],
+        'Grade': ['B', 'C', 'A', 'B', 'C', 'B', 'C']
+    })
+    rules = RuleSet([
+        ('Excellent', [('Score', '>=', 85)]),
+        ('Good', [('Score', '>=', 70), ('Score', '<', 85)]),
+        ('Poor', [('Score', '<', 70)]),
+    ], default='Unknown')
+    df1['Performance'] = rules.apply(df1)
+    print(df1)
+
+    # Output:
+    #       Name  Score Grade Performance
+    # 0    Alice     85     B   Excellent
+    # 1      Bob     67     C        Poor
+    # 2  Charlie     90     A   Excellent
+    # 3    Alice     85     B   Excellent
+    # 4      Eve     67     C        Poor
+    # 5    Frank     77     B        Good
+    # 6      Bob     67     C        Poor
+
+    print(bucketize(df1['Score'], bins=[70, 85], labels=['Good', 'Excellent'], below='Poor'))
+    print(benchmark(n_rows=2_000_000))
@@ -0,0 +1,324 @@
+# =========================
+# Approximate nunique() and top-k sketches for code.py's unique/nunique section
+# =========================
+#
+# df1['Score'].unique() and .nunique() keep every distinct value in memory. These sketches
+# use a fixed amount of memory, can be built chunk by chunk, merged, and saved to bytes so
+# later runs can combine them.
+#
+# HyperLogLog(p)          — distinct count. 2**p one-byte registers.
+#                           Relative standard error ≈ 1.04 / sqrt(2**p) (p=14: 0.81%, 16 KiB).
+# CountMinSketch(w, d)    — frequency of any value. w*d int64 counters.
+#                           Never underestimates; estimate ≤ true + (e / w) * N with
+#                           probability ≥ 1 - e**-d  (N = total rows added).
+# SpaceSaving(k)          — the k most frequent values with per-value error.
+#                           count - error ≤ true count ≤ count, and error ≤ N / k, so every
+#                           value with true count > N / k is in the summary.
+#
+# All three hash values with pd.util.hash_pandas_object, so sketches built in different
+# runs agree as long as the dtype is the same: 1 and 1.0 hash differently.
+
+import io
+import math
+
+import numpy as np
+import pandas as pd
+
+HASH_KEY = '0123456789abcdef'       # second, independent hash for CountMinSketch rows
+
+
+def _hash(values, hash_key=None):
+    values = pd.Series(values)
+    if hash_key is None:
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+    return pd.util.hash_pandas_object(values, index=False, hash_key=hash_key).to_numpy()
+
+
+def _dropna(values):
+    values = pd.Series(values)
+    return values[values.notna()]
+
+
+# 🟢 Number of significant bits of each uint64 (0 for 0), without going through float
+def _bit_length(x):
+    x = x.copy()
+    n = np.zeros(len(x), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        big = x >= (np.uint64(1) << np.uint64(shift))
+        n[big] += shift
+        x[big] >>= np.uint64(shift)
+    return n + (x > 0)
+
+
+# =========================
+# Serialization: every sketch is a .npz archive in memory with a 'kind' entry
+# =========================
+
+def _dump(kind, **arrays):
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, kind=np.asarray(kind), **arrays)
+    return buffer.getvalue()
+
+
+def load_sketch(data):
+    with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+        arrays = {name: archive[name] for name in archive.files}
+    kinds = {'hll': HyperLogLog, 'cms': CountMinSketch, 'spacesaving': SpaceSaving}
+    return kinds[str(arrays.pop('kind'))]._from_arrays(arrays)
+
+
+def _same_shape(a, b, *attrs):
+    if type(a) is not type(b) or any(getattr(a, attr) != getattr(b, attr) for attr in attrs):
+        raise ValueError(f'Cannot merge sketches with different {", ".join(attrs)}')
+
+
+# =========================
+# HyperLogLog: approximate nunique()
+# =========================
+
+class HyperLogLog:
+
+    def __init__(self, p=14):
+        if not 4 <= p <= 18:
+            raise ValueError('p must be between 4 and 18')
+        self.p = p
+        self.registers = np.zeros(2 ** p, dtype=np.uint8)
+
+    @property
+    def standard_error(self):
+        return 1.04 / math.sqrt(len(self.registers))
+
+    # Same as Series.nunique(): NaN is not counted
+    def add(self, values):
+        h = _hash(_dropna(values))
+        bucket = (h >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = h & np.uint64((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - _bit_length(rest) + 1
+        np.maximum.at(self.registers, bucket, rank.astype(np.uint8))
+        return self
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)      # linear counting for small cardinalities
+        return raw
+
+    def nunique(self):
+        return int(round(self.estimate()))
+
+    def merge(self, other):
+        _same_shape(self, other, 'p')
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def to_bytes(self):
+        return _dump('hll', p=np.asarray(self.p), registers=self.registers)
+
+    @classmethod
+    def _from_arrays(cls, arrays):
+        sketch = cls(int(arrays['p']))
+        sketch.registers = arrays['registers'].copy()
+        return sketch
+
+
+# =========================
+# Count-Min sketch: approximate value_counts() for any value
+# =========================
+
+class CountMinSketch:
+
+    def __init__(self, width=2 ** 16, depth=5):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+
+    # 🟢 Size the sketch for "error ≤ epsilon * N with probability ≥ 1 - delta"
+    @classmethod
+    def from_error(cls, epsilon=1e-4, delta=1e-3):
+        return cls(width=int(math.ceil(math.e / epsilon)), depth=int(math.ceil(math.log(1 / delta))))
+
+    @property
+    def epsilon(self):
+        return math.e / self.width
+
+    @property
+    def delta(self):
+        return math.exp(-self.depth)
+
+    # One column per row of the table: (h1 + i * h2) % width
+    def _columns(self, values):
+        h1 = _hash(values)
+        h2 = _hash(values, HASH_KEY) | np.uint64(1)
+        i = np.arange(self.depth, dtype=np.uint64)
+        with np.errstate(over='ignore'):
+            return ((h1[None, :] + i[:, None] * h2[None, :]) % np.uint64(self.width)).astype(np.int64)
+
+    def add(self, values):
+        counts = _dropna(values).value_counts(sort=False)
+        if len(counts):
+            cols = self._columns(counts.index.to_series(index=None))
+            for row in range(self.depth):
+                np.add.at(self.table[row], cols[row], counts.to_numpy())
+            self.total += int(counts.sum())
+        return self
+
+    def estimate(self, values):
+        cols = self._columns(values)
+        return self.table[np.arange(self.depth)[:, None], cols].min(axis=0)
+
+    def merge(self, other):
+        _same_shape(self, other, 'width', 'depth')
+        self.table += other.table
+        self.total += other.total
+        return self
+
+    def to_bytes(self):
+        return _dump('cms', table=self.table, total=np.asarray(self.total))
+
+    @classmethod
+    def _from_arrays(cls, arrays):
+        depth, width = arrays['table'].shape
+        sketch = cls(width, depth)
+        sketch.table = arrays['table'].copy()
+        sketch.total = int(arrays['total'])
+        return sketch
+
+
+# =========================
+# SpaceSaving: approximate value_counts().head(k)
+# Each chunk is counted exactly with value_counts() and merged into the summary.
+# A value missing from a full summary may have been seen up to floor (= the smallest
+# tracked count) times, so it is merged with count = error = floor; then only the k
+# largest counts are kept.
+# =========================
+
+class SpaceSaving:
+
+    def __init__(self, k=100):
+        self.k = k
+        self.counts = pd.Series(dtype='int64')
+        self.errors = pd.Series(dtype='int64')
+        self.total = 0
+
+    @property
+    def floor(self):
+        return int(self.counts.min()) if len(self.counts) >= self.k else 0
+
+    def _combine(self, counts, errors, floor, total):
+        keys = self.counts.index.union(counts.index)
+        own, other = self.floor, floor
+        combined = self.counts.reindex(keys, fill_value=own) + counts.reindex(keys, fill_value=other)
+        error = self.errors.reindex(keys, fill_value=own) + errors.reindex(keys, fill_value=other)
+        top = combined.sort_values(ascending=False, kind='stable').iloc[:self.k]
+        self.counts = top
+        self.errors = error[top.index]
+        self.total += total
+        return self
+
+    def add(self, values):
+        counts = _dropna(values).value_counts()
+        return self._combine(counts, pd.Series(0, index=counts.index, dtype='int64'), 0, int(counts.sum()))
+
+    def merge(self, other):
+        _same_shape(self, other, 'k')
+        return self._combine(other.counts, other.errors, other.floor, other.total)
+
+    # Like value_counts().head(n), with the guaranteed lower bound of each count
+    def top(self, n=None):
+        counts = self.counts.iloc[:n]
+        return pd.DataFrame({'count': counts, 'error': self.errors[counts.index],
+                             'lower': counts - self.errors[counts.index]})
+
+    def to_bytes(self):
+        keys = self.counts.index.to_numpy()
+        if keys.dtype == object:
+            keys = keys.astype(str)
+        return _dump('spacesaving', k=np.asarray(self.k), keys=keys, counts=self.counts.to_numpy(),
+                     errors=self.errors.to_numpy(), total=np.asarray(self.total))
+
+    @classmethod
+    def _from_arrays(cls, arrays):
+        sketch = cls(int(arrays['k']))
+        index = pd.Index(arrays['keys'])
+        sketch.counts = pd.Series(arrays['counts'], index=index)
+        sketch.errors = pd.Series(arrays['errors'], index=index)
+        sketch.total = int(arrays['total'])
+        return sketch
+
+
+# =========================
+# Check the documented error bounds against the exact pandas methods
+# =========================
+
+def check_error_bounds(n_rows=2_000_000, n_values=500_000, chunksize=250_000, seed=0):
+    rng = np.random.default_rng(seed)
+    # Zipf-like skew, so there is a clear top-k and a long tail
+    values = pd.Series((rng.zipf(1.3, n_rows) % n_values).astype('int64'))
+    exact = values.value_counts()
+
+    # Build each sketch from two halves of chunks, then merge after a bytes round trip
+    half = n_rows // 2
+    sketches = []
+    for part in (values.iloc[:half], values.iloc[half:]):
+        hll, cms, ss = HyperLogLog(14), CountMinSketch.from_error(1e-4, 1e-3), SpaceSaving(1000)
+        for start in range(0, len(part), chunksize):
+            chunk = part.iloc[start:start + chunksize]
+            hll.add(chunk), cms.add(chunk), ss.add(chunk)
+        sketches.append([load_sketch(s.to_bytes()) for s in (hll, cms, ss)])
+    hll, cms, ss = (a.merge(b) for a, b in zip(*sketches))
+
+    true_n = values.nunique()
+    cms_over = cms.estimate(exact.index.to_series(index=None)) - exact.to_numpy()
+    top = ss.top()
+    true_top = exact.reindex(top.index, fill_value=0)
+    k_true = exact[exact > n_rows / ss.k]
+    return {
+        'hll_estimate': hll.nunique(),
+        'nunique': true_n,
+        'hll_relative_error': abs(hll.estimate() - true_n) / true_n,
+        'hll_standard_error': hll.standard_error,
+        'cms_never_under': bool((cms_over >= 0).all()),
+        'cms_share_over_epsilon_n': float(np.mean(cms_over > cms.epsilon * n_rows)),
+        'cms_delta': cms.delta,
+        'ss_bracket_holds': bool(((top['lower'] <= true_top) & (true_top <= top['count'])).all()),
+        'ss_max_error': int(top['error'].max()),
+        'ss_error_bound': n_rows / ss.k,
+        'ss_heavy_hitters_found': bool(k_true.index.isin(top.index).all()),
+        'ss_top10_matches': list(top.index[:10]) == list(exact.index[:10]),
+        'sketch_bytes': {type(s).__name__: len(s.to_bytes()) for s in (hll, cms, ss)},
+    }
+
+
+if __name__ == '__main__':
+    # =========================
+    # Same df1 as code.py
+    # =========================
+    df1 = pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie', 'Alice', 'Eve', 'Frank', 'Bob'],
+        'Score': [85, 67, 90, 85, 67, 77, 67],
+        'Grade': ['B', 'C', 'A', 'B', 'C', 'B', 'C']
+    })
+
+    print("# Approximate number of unique scores:", HyperLogLog().add(df1['Score']).nunique())
+    print("# Most frequent scores:")
+    print(SpaceSaving(k=3).add(df1['Score']).top())
+    print("# Count-Min estimate for 67 and 85:", CountMinSketch(1024, 4).add(df1['Score']).estimate([67, 85]))
+
+    # Output:
+    # # Approximate number of unique scores: 4
+    # # Most frequent scores:
+    #     count  error  lower
+    # 67      3      0      3
+    # 85      2      0      2
+    # 90      1      0      1
+    # # Count-Min estimate for 67 and 85: [3 2]
+
+    # =========================
+    # Error bounds on 2M skewed values, built in chunks, merged and round-tripped through bytes
+    # =========================
+    for name, value in check_error_bounds().items():
+        print(f"# {name}: {value}")
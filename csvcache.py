@@ -0,0 +1,150 @@
+# 📌 Columnar on-disk cache for CSV files
+# First load parses the CSV and writes a binary columnar copy (Feather/Arrow IPC).
+# Later loads memory-map that copy instead of re-parsing text.
+# The cache key is the CSV's absolute path + size + mtime, so editing the CSV
+# invalidates its cache automatically.
+#
+# Feather needs pyarrow. Without it, each column is saved as a .npy file
+# (memory-mapped on load) and text columns fall back to a pickle.
+# The index (e.g. from index_col=0) is stored too, so a warm load equals the cold one.
+# A cache entry is written under a temporary name and renamed into place, so a reader
+# never sees a half-written file.
+
+import hashlib
+import os
+import pickle
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - depends on the environment
+    feather = None
+
+CACHE_DIR = '.csv_cache'
+
+
+# 🟢 Cache file name = hash(path) + hash(path, size, mtime)
+def _cache_key(path):
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    source = hashlib.sha1(path.encode()).hexdigest()[:16]
+    version = hashlib.sha1(f'{path}|{stat.st_size}|{stat.st_mtime_ns}'.encode()).hexdigest()[:16]
+    return source, version
+
+
+# 🟢 Remove cache entries built from an older version of the same source file
+def _drop_stale(cache_dir, source, version):
+    for name in os.listdir(cache_dir):
+        if name.startswith(source + '-') and not name.startswith(f'{source}-{version}'):
+            target = os.path.join(cache_dir, name)
+            if os.path.isdir(target):
+                for inner in os.listdir(target):
+                    os.remove(os.path.join(target, inner))
+                os.rmdir(target)
+            else:
+                os.remove(target)
+
+
+# 🟢 Fallback writer/reader: one .npy per numeric column, pickle for the rest
+def _write_npy(df, folder):
+    os.makedirs(folder, exist_ok=True)
+    objects = {}
+    for i, name in enumerate(df.columns):
+        col = df[name]
+        if col.dtype.kind in 'biufcmM':
+            np.save(os.path.join(folder, f'{i}.npy'), col.to_numpy())
+        else:
+            objects[name] = col
+    with open(os.path.join(folder, 'meta.pkl'), 'wb') as f:
+        pickle.dump({'columns': list(df.columns), 'objects': objects, 'index': df.index}, f)
+
+
+def _read_npy(folder):
+    with open(os.path.join(folder, 'meta.pkl'), 'rb') as f:
+        meta = pickle.load(f)
+    data = {}
+    for i, name in enumerate(meta['columns']):
+        if name in meta['objects']:
+            data[name] = meta['objects'][name]
+        else:
+            data[name] = np.load(os.path.join(folder, f'{i}.npy'), mmap_mode='r')
+    return pd.DataFrame(data, index=meta['index'], copy=False)
+
+
+# 🟢 Drop-in replacement for pd.read_csv with a columnar cache
+def read_csv_cached(path, cache_dir=CACHE_DIR, return_info=False, **read_kwargs):
+    start = time.perf_counter()
+    os.makedirs(cache_dir, exist_ok=True)
+    source, version = _cache_key(path)
+    _drop_stale(cache_dir, source, version)
+    if read_kwargs:
+        # Different parse options give a different frame, so they get their own entry
+        version += '-' + hashlib.sha1(repr(sorted(read_kwargs.items())).encode()).hexdigest()[:8]
+
+    if feather is not None:
+        target = os.path.join(cache_dir, f'{source}-{version}.feather')
+    else:
+        target = os.path.join(cache_dir, f'{source}-{version}.npy.d')
+
+    if os.path.exists(target):
+        status = 'warm'
+        if feather is not None:
+            df = feather.read_feather(target, memory_map=True)
+        else:
+            df = _read_npy(target)
+    else:
+        status = 'cold'
+        df = pd.read_csv(path, **read_kwargs)
+        partial = f'{target}.tmp-{os.getpid()}'
+        if feather is not None:
+            # Uncompressed, so the warm load can memory-map it directly
+            feather.write_feather(df, partial, compression='uncompressed')
+        else:
+            _write_npy(df, partial)
+        try:
+            os.replace(partial, target)
+        except OSError:             # another process already put its copy of the folder there
+            shutil.rmtree(partial, ignore_errors=True)
+
+    if return_info:
+        return df, {'status': status, 'seconds': time.perf_counter() - start, 'cache': target}
+    return df
+
+
+# 🟢 Cold vs warm load timings for one CSV
+def benchmark(path, cache_dir=CACHE_DIR, repeat=3, **read_kwargs):
+    rows = []
+    for _ in range(repeat):
+        source, _ = _cache_key(path)
+        if os.path.isdir(cache_dir):
+            _drop_stale(cache_dir, source, 'none')     # force a cold load
+        _, cold = read_csv_cached(path, cache_dir, return_info=True, **read_kwargs)
+        _, warm = read_csv_cached(path, cache_dir, return_info=True, **read_kwargs)
+        rows.append({'cold_s': cold['seconds'], 'warm_s': warm['seconds']})
+    result = pd.DataFrame(rows)
+    result['speedup'] = result['cold_s'] / result['warm_s']
+    return result
+
+
+if __name__ == '__main__':
+    # 📌 Build a CSV shaped like /mnt/data/linear1.csv (X1, X2, Y), but large
+    rng = np.random.default_rng(0)
+    n = 1_000_000
+    x1 = rng.integers(10, 100, n)
+    x2 = rng.integers(20, 200, n)
+    pd.DataFrame({'X1': x1, 'X2': x2, 'Y': 2 * x1 + 3 * x2 + rng.normal(0, 5, n)}).to_csv(
+        'linear_big.csv', index=False)
+
+    print("🔹 Cold vs warm load (seconds):")
+    print(benchmark('linear_big.csv'))
+
+    # Touching the source invalidates the cache → next load is cold again
+    os.utime('linear_big.csv')
+    _, info = read_csv_cached('linear_big.csv', return_info=True)
+    print("\n🔹 After touching the CSV:", info['status'])
+    # Output:
+    # 🔹 After touching the CSV: cold
@@ -3,10 +3,13 @@ import numpy as np
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
 import matplotlib.pyplot as plt
+from csvcache import read_csv_cached
 
 #🟢 Load the dataset
-df = pd.read_csv('/mnt/data/linear1.csv')
+df = read_csv_cached('/mnt/data/linear1.csv')
 #👉 Reads the CSV file and stores it in a DataFrame called 'df'
+#👉 The first run saves a columnar copy in .csv_cache/, later runs memory-map it
+#👉 Editing the CSV changes its size/mtime, so the cached copy is rebuilt automatically
 #👉 This creates a table with columns like X1, X2, and Y
 #👉 Example:
 #     X1   X2    Y
@@ -0,0 +1,214 @@
+# 🟢 Low-copy melt / pivot for code11.py (pd.melt) and code6.py / code07.py (pivot, pivot_table)
+#
+# pd.melt and df.pivot copy every value and rebuild the labels through hashing. Here:
+#
+# melt()              — the 'value' column of a melt is all of value_vars[0], then all of
+#                       value_vars[1], ... so it is built with a single concatenate. With one
+#                       value column, the id and value columns are views of the input instead.
+#                       The 'variable' column is a Categorical (int8 codes) instead of
+#                       repeated strings.
+# pivot()             — when the rows are already ordered index-major with every column label
+#                       present once per index label (a complete grid), column j of the result
+#                       is the strided view values[j::n_columns]: nothing is copied.
+#                       Otherwise one scatter copy.
+# pivot_table_codes() — pivot_table for low-cardinality keys. Categorical keys are used
+#                       through their codes directly (no hashing); other keys are factorized
+#                       once. Every cell is then aggregated with np.bincount over
+#                       code_row * n_columns + code_col.
+#
+# Views are always taken through pandas (df[c], .iloc, set_axis), never from raw numpy
+# arrays, so copy-on-write tracks them: a later write to the input copies first and does
+# not show up in the result, and the other way round.
+# Adjacent value columns of one block could make the melt value column a view too, but
+# pandas has no tracked 1-D view over a 2-D block, so that case stays one concatenate.
+
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+AGGFUNCS = ('mean', 'sum', 'count', 'min', 'max')
+
+
+def _stacked_values(df, value_vars):
+    arrays = [df[c].array for c in value_vars]
+    arrays = [a._ndarray if isinstance(a, pd.arrays.NumpyExtensionArray) else a for a in arrays]
+    if all(isinstance(a, np.ndarray) for a in arrays):
+        return np.concatenate(arrays)          # a new array: nothing shared with df
+    return pd.concat([df[c] for c in value_vars], ignore_index=True).array
+
+
+# 🟢 Same rows as pd.melt(df, id_vars, value_vars, var_name, value_name);
+# zero_copy in the result's attrs tells whether the value column is a view
+def melt(df, id_vars, value_vars, var_name='variable', value_name='value'):
+    id_vars, value_vars = list(id_vars), list(value_vars)
+    n, k = len(df), len(value_vars)
+    zero_copy = k == 1
+    if zero_copy:
+        # One value column: every output column is an input column under a new index
+        out = {c: df[c].set_axis(pd.RangeIndex(n)) for c in id_vars}
+        values = df[value_vars[0]].set_axis(pd.RangeIndex(n))
+    else:
+        out = {c: df[c].take(np.tile(np.arange(n), k)).array for c in id_vars}
+        values = _stacked_values(df, value_vars)
+    out[var_name] = pd.Categorical.from_codes(np.repeat(np.arange(k, dtype=np.int8), n), categories=value_vars)
+    out[value_name] = values
+    result = pd.DataFrame(out, copy=False)
+    result.attrs['zero_copy'] = zero_copy
+    return result
+
+
+def _sorted_codes(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Categorical keys: the codes already are dense integers, nothing to hash.
+        # Only observed categories become labels (in category order), like df.pivot
+        codes = series.cat.codes.to_numpy()
+        n_cat = len(series.cat.categories)
+        used = np.flatnonzero(np.bincount(codes[codes >= 0], minlength=n_cat))
+        renumber = np.full(n_cat + 1, -1, dtype=codes.dtype)   # last slot keeps code -1 as -1
+        renumber[used] = np.arange(len(used))
+        return renumber[codes], pd.Categorical.from_codes(used, dtype=series.dtype)
+    return pd.factorize(series, sort=True)
+
+
+# 🟢 One int64 cell number per row (row code * n_columns + column code), built in place
+def _cell_codes(df, index, columns):
+    ri, row_labels = _sorted_codes(df[index])
+    ci, col_labels = _sorted_codes(df[columns])
+    missing = (ri < 0) | (ci < 0)
+    flat = ri.astype(np.int64)
+    flat *= len(col_labels)
+    flat += ci
+    return flat, missing, row_labels, col_labels
+
+
+# 🟢 flat == 0, 1, 2, ..., checked block by block to avoid a second full-size array
+def _is_identity(flat, block=1 << 20):
+    return all((flat[i:i + block] == np.arange(i, min(i + block, len(flat)))).all()
+               for i in range(0, len(flat), block))
+
+
+# 🟢 Same as df.pivot(index=..., columns=..., values=...)
+def pivot(df, index, columns, values):
+    flat, missing, row_labels, col_labels = _cell_codes(df, index, columns)
+    if missing.any():
+        return df.pivot(index=index, columns=columns, values=values)   # NaN keys: leave to pandas
+    n, m = len(row_labels), len(col_labels)
+    row_index, col_index = pd.Index(row_labels, name=index), pd.Index(col_labels, name=columns)
+    if len(flat) == n * m and _is_identity(flat):
+        # Complete grid in index-major order: column j is every m-th value from row j on
+        source = df[values]
+        grid = pd.DataFrame({j: source.iloc[j::m].set_axis(row_index) for j in range(m)}, copy=False)
+        grid.columns = col_index
+        return grid
+    if len(np.unique(flat)) != len(flat):
+        raise ValueError('Index contains duplicate entries, cannot reshape')
+    data = df[values].to_numpy()
+    if len(flat) == n * m:
+        grid = np.empty(n * m, dtype=data.dtype)   # every cell gets a value: keep the dtype
+    else:
+        grid = np.full(n * m, np.nan, dtype=np.result_type(data.dtype, np.float64))
+    grid[flat] = data
+    return pd.DataFrame(grid.reshape(n, m), index=row_index, columns=col_index, copy=False)
+
+
+# 🟢 Same as df.pivot_table(index=..., columns=..., values=..., aggfunc=...) for one value column
+def pivot_table_codes(df, index, columns, values, aggfunc='mean'):
+    if aggfunc not in AGGFUNCS:
+        raise ValueError(f'aggfunc must be one of {AGGFUNCS}')
+    flat, missing, row_labels, col_labels = _cell_codes(df, index, columns)
+    n, m = len(row_labels), len(col_labels)
+    data = df[values].to_numpy(dtype=np.float64, na_value=np.nan)
+    keep = ~missing & ~np.isnan(data)
+    if not keep.all():
+        flat, data = flat[keep], data[keep]
+
+    count = np.bincount(flat, minlength=n * m)
+    if aggfunc in ('mean', 'sum'):
+        total = np.bincount(flat, weights=data, minlength=n * m)
+        grid = total / np.where(count, count, 1) if aggfunc == 'mean' else total
+    elif aggfunc == 'count':
+        grid = count.astype(np.float64)
+    else:
+        grid = np.full(n * m, np.inf if aggfunc == 'min' else -np.inf)
+        (np.minimum if aggfunc == 'min' else np.maximum).at(grid, flat, data)
+    grid = np.where(count > 0, grid, np.nan).reshape(n, m)
+
+    # Like pivot_table(dropna=True, observed=True): drop labels without any value
+    seen = count.reshape(n, m)
+    rows, cols = seen.any(axis=1), seen.any(axis=0)
+    return pd.DataFrame(grid[rows][:, cols], index=pd.Index(np.asarray(row_labels)[rows], name=index),
+                        columns=pd.Index(np.asarray(col_labels)[cols], name=columns))
+
+
+# =========================
+# 🟢 Benchmark at 10M+ rows: time and peak traced memory against pandas
+# =========================
+
+def _measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = fn()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return out, {'seconds': seconds, 'peak_mb': peak / 2 ** 20}
+
+
+def benchmark(n_rows=10_000_000, n_subjects=50, seed=0):
+    rng = np.random.default_rng(seed)
+    results = {}
+
+    # melt: two float value columns created together (one block)
+    wide = pd.DataFrame({'id': np.arange(n_rows), 'sales': rng.random(n_rows), 'score': rng.random(n_rows)})
+    expected, results['pd.melt'] = _measure(lambda: pd.melt(wide, id_vars=['id'], value_vars=['sales', 'score']))
+    got, results['melt'] = _measure(lambda: melt(wide, ['id'], ['sales', 'score']))
+    assert (got['value'].to_numpy() == expected['value'].to_numpy()).all()
+    del expected, got, wide
+
+    # pivot: complete Name × Subject grid, already in Name-major order
+    n_names = n_rows // n_subjects
+    long = pd.DataFrame({'Name': np.repeat(np.arange(n_names), n_subjects),
+                         'Subject': np.tile(np.arange(n_subjects), n_names),
+                         'Score': rng.integers(0, 100, n_rows)})
+    expected, results['df.pivot'] = _measure(lambda: long.pivot(index='Name', columns='Subject', values='Score'))
+    got, results['pivot'] = _measure(lambda: pivot(long, 'Name', 'Subject', 'Score'))
+    assert (got.to_numpy() == expected.to_numpy()).all()
+    del expected, got
+
+    # pivot_table: shuffled rows with categorical keys and duplicates
+    shuffled = long.sample(frac=1.0, random_state=seed)
+    shuffled['Name'] = pd.Categorical(shuffled['Name'] % (n_names // 10))
+    shuffled['Subject'] = pd.Categorical(shuffled['Subject'])
+    expected, results['df.pivot_table'] = _measure(
+        lambda: shuffled.pivot_table(index='Name', columns='Subject', values='Score', aggfunc='mean', observed=True))
+    got, results['pivot_table_codes'] = _measure(lambda: pivot_table_codes(shuffled, 'Name', 'Subject', 'Score'))
+    assert np.allclose(got.to_numpy(), expected.to_numpy(), equal_nan=True)
+    return results
+
+
+if __name__ == '__main__':
+    # 🟢 Same df1 as code6.py / code07.py
+    df1 = pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Alice', 'Bob', 'Charlie', 'Charlie', 'Alice', 'Bob'],
+        'Subject': ['Math', 'Math', 'Science', 'Science', 'Math', 'Science', 'SST', 'SST'],
+        'Score': [85, 78, 90, 82, 88, 95, 75, 70]
+    })
+    print(pivot(df1, 'Name', 'Subject', 'Score'))
+    print(pivot_table_codes(df1.astype({'Name': 'category', 'Subject': 'category'}), 'Name', 'Subject', 'Score'))
+
+    # Output:
+    # Subject  Math   SST  Science
+    # Name
+    # Alice    85.0  75.0     90.0
+    # Bob      78.0  70.0     82.0
+    # Charlie  88.0   NaN     95.0
+
+    # 🟢 code11.py's melt over sales / score
+    df = pd.DataFrame({'id': [1, 2, 3], 'name': ['Alice', 'Bob', 'Charlie'],
+                       'sales': [100.0, 200.0, 150.0], 'score': [90.0, 80.0, 70.0]})
+    melted = melt(df, ['id', 'name'], ['sales', 'score'], var_name='metric', value_name='value')
+    print(melted)
+
+    print(benchmark())